@@ -0,0 +1,7 @@
+"""
+GitHub Master Monitor: a 7-step project board per repo plus a Master Project dashboard.
+
+Importing the package loads nothing else; pull in the module you need
+(e.g. `github_master_monitor.metrics`) or use the `github-master-monitor` CLI.
+"""
+__version__ = "0.1.0"
@@ -0,0 +1,82 @@
+"""Benchmark: full syncs against the offline stub API, reporting time and request counts."""
+import contextlib
+import os
+import tempfile
+import threading
+import time
+
+from . import config, templates
+from .cli import use_stub
+from .graphql import API_USAGE, clear_read_cache, run_query
+from .profiling import PHASE_STATS
+from .repos import VIEWER_QUERY
+from .sync import run_sync
+
+
+def _bench_syncs(repo_count, runs, coalesce):
+    """Runs `runs` consecutive syncs on a fresh stub; returns (run, wall, requests, coalesced) rows."""
+    config.GRAPHQL_COALESCE = coalesce
+    rows = []
+    with tempfile.TemporaryDirectory() as state_dir:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            stub = use_stub(repo_count, state_dir)
+        try:
+            for run in range(1, runs + 1):
+                PHASE_STATS.clear()
+                templates._validated_templates.clear()
+                requests_before = API_USAGE["requests"]
+                coalesced_before = API_USAGE["coalesced"]
+                started = time.perf_counter()
+                with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                    run_sync()
+                rows.append((run, time.perf_counter() - started, API_USAGE["requests"] - requests_before,
+                             API_USAGE["coalesced"] - coalesced_before))
+            concurrent = _bench_concurrent_reads() if coalesce else None
+        finally:
+            stub.terminate()
+    return rows, concurrent
+
+
+def _bench_concurrent_reads(threads=16):
+    """Fires the same read from `threads` threads at once; returns the number of requests sent."""
+    clear_read_cache()
+    barrier = threading.Barrier(threads)
+
+    def read():
+        barrier.wait()
+        run_query(VIEWER_QUERY)
+
+    requests_before = API_USAGE["requests"]
+    workers = [threading.Thread(target=read) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads, API_USAGE["requests"] - requests_before
+
+
+def run_bench(repo_count, runs=2):
+    """
+    Runs `runs` consecutive syncs over `repo_count` synthetic repos, with read coalescing
+    off and then on, and prints one row per run. The first run provisions every board and
+    card; later runs measure a steady-state sync. Sync output is discarded.
+    """
+    coalesce = config.GRAPHQL_COALESCE
+    results = {}
+    try:
+        for mode in (False, True):
+            results[mode] = _bench_syncs(repo_count, runs, mode)
+    finally:
+        config.GRAPHQL_COALESCE = coalesce
+
+    print(f"{'coalesce':<10}{'run':>4}{'wall s':>10}{'requests':>10}{'req/repo':>10}{'coalesced':>11}")
+    for mode, (rows, _) in results.items():
+        for run, wall, requests, coalesced in rows:
+            print(f"{'on' if mode else 'off':<10}{run:>4}{wall:>10.2f}{requests:>10}"
+                  f"{requests / max(repo_count, 1):>10.2f}{coalesced:>11}")
+
+    for (run, _, off, _), (_, _, on, _) in zip(results[False][0], results[True][0]):
+        print(f"[INFO] Run {run}: {off} -> {on} requests ({100 * (off - on) / max(off, 1):.0f}% fewer)")
+    threads, sent = results[True][1]
+    print(f"[INFO] {threads} concurrent identical reads sent {sent} request(s)")
+    return results
@@ -0,0 +1,190 @@
+"""
+Command-line entry point: `github-master-monitor <command>`.
+
+Each command imports what it needs when it runs, so local commands (`status`, `report`) only
+read local files and never load the HTTP stack or touch the network.
+"""
+import argparse
+import os
+import sys
+
+
+def use_stub(repo_count, state_dir):
+    """
+    Points the client at a stub API with `repo_count` synthetic repos (see stub_server.py).
+    Mapping/state/report data files are redirected into `state_dir` so the real ones stay untouched.
+    Returns the stub process; call terminate() when done.
+    """
+    from . import config
+    from .stub_server import spawn_stub_server
+
+    process, url = spawn_stub_server(repo_count, login=config.USERNAME)
+    config.API_URL = url
+    os.environ["MASTER_PROJECT_ID"] = "ghp_stub"
+    os.makedirs(state_dir, exist_ok=True)
+    config.MAPPING_FILE = os.path.join(state_dir, "stub_" + os.path.basename(config.MAPPING_FILE))
+    config.SYNC_STATE_FILE = os.path.join(state_dir, "stub_" + os.path.basename(config.SYNC_STATE_FILE))
+    config.REPORT_DATA_FILE = os.path.join(state_dir, "stub_" + os.path.basename(config.REPORT_DATA_FILE))
+    print(f"[INFO] Using stub GitHub API with {repo_count} repos at {url}")
+    return process
+
+
+def cmd_sync(args):
+    from .sync import run_sync
+
+    stub = use_stub(args.stub_repos, args.profile_dir) if args.stub_repos else None
+    try:
+        if args.profile:
+            from .profiling import run_profiled
+
+            ok = run_profiled(run_sync, args.profile_dir)
+        elif args.phases:
+            from .profiling import run_timed
+
+            ok = run_timed(run_sync, args.profile_dir)
+        else:
+            ok = run_sync()
+        if not ok:
+            return 1
+    finally:
+        if stub:
+            stub.terminate()
+    return 0
+
+
+def cmd_plan(args):
+    from .scheduler import priority_reason, schedule_repos
+    from .state import load_sync_state
+    from .sync import discover_repos
+
+    state = load_sync_state()
+    _, repos = discover_repos()
+    scheduled = schedule_repos(repos, state)
+
+    print(f"{'#':>5}  {'repo':<40}{'reason':<11}{'pushed':<22}last synced")
+    for index, repo in enumerate(scheduled[:args.limit], 1):
+        print(f"{index:>5}  {repo['name']:<40}{priority_reason(repo, state):<11}"
+              f"{repo.get('pushedAt') or '-':<22}{state['last_synced'].get(repo['name'], '-')}")
+    if len(scheduled) > args.limit:
+        print(f"... {len(scheduled) - args.limit} more")
+    return 0
+
+
+def cmd_status(args):
+    from .state import load_mapping, load_sync_state
+
+    mapping = load_mapping()
+    state = load_sync_state()
+    last_synced = sorted(state["last_synced"].values())
+
+    print(f"Master project:   {mapping.get('master_project_id') or '-'}")
+    print(f"Template project: {mapping.get('template_project_id') or '-'}")
+    print(f"Tracked repos:    {len(mapping['repos'])}")
+    print(f"Synced repos:     {len(last_synced)}")
+    if last_synced:
+        print(f"Last sync:        oldest {last_synced[0]}, newest {last_synced[-1]}")
+    print(f"Pending repos:    {len(state['pending'])}")
+    for name in sorted(state["pending"])[:10]:
+        print(f"  - {name}")
+    if len(state["pending"]) > 10:
+        print(f"  ... {len(state['pending']) - 10} more")
+    print(f"Off-schema boards: {len(state['off_schema'])}")
+    for name, options in sorted(state["off_schema"].items())[:10]:
+        print(f"  - {name}: Status is {', '.join(options)}")
+    if len(state["off_schema"]) > 10:
+        print(f"  ... {len(state['off_schema']) - 10} more")
+    return 0
+
+
+def cmd_dedupe(args):
+    from .master import delete_project_items, find_duplicate_master_cards
+    from .state import load_mapping
+
+    master_project_id = load_mapping().get("master_project_id")
+    if not master_project_id or master_project_id == "ID_MASTER":
+        print("[ERROR] No master project ID in the mapping file; run `sync` first")
+        return 1
+
+    duplicates = find_duplicate_master_cards(master_project_id)
+    item_ids = [item_id for ids in duplicates.values() for item_id in ids]
+    for repo_name, ids in sorted(duplicates.items()):
+        print(f"[INFO] {repo_name}: {len(ids)} duplicate card(s)")
+    if not item_ids:
+        print("[INFO] No duplicate master cards")
+    elif args.dry_run:
+        print(f"[INFO] Dry run: would delete {len(item_ids)} cards")
+    else:
+        delete_project_items(master_project_id, item_ids)
+        print(f"[INFO] Deleted {len(item_ids)} duplicate cards")
+    return 0
+
+
+def cmd_report(args):
+    from . import config
+    from .report import iter_report_records, render_report
+
+    data = args.data or config.REPORT_DATA_FILE
+    if not os.path.exists(data):
+        print(f"[ERROR] No report data at {data}; run `sync` first")
+        return 1
+    summary = render_report(iter_report_records(data), args.out_dir, stale_days=args.stale_days)
+    print(f"[INFO] Wrote {args.out_dir}/report.md and report.html: {summary['repos']} repos, "
+          f"{summary['stale']} stale, {summary['missing']} missing boards "
+          f"({summary['cached_chunks']}/{summary['chunks']} chunks from cache)")
+    return 0
+
+
+def cmd_bench(args):
+    from .bench import run_bench
+
+    run_bench(args.repos, runs=args.runs)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="github-master-monitor",
+        description="Keep a 7-step project board per repo and a Master Project dashboard in sync.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sync = commands.add_parser("sync", help="create/update repo boards, master cards and metrics")
+    sync.add_argument("--profile", action="store_true",
+                      help="profile the run: per-phase timings, cProfile dump and collapsed stacks")
+    sync.add_argument("--phases", action="store_true",
+                      help="only time each phase (no profiler attached) and write phases.txt")
+    sync.add_argument("--profile-dir", default="profile", help="where --profile/--phases (and --stub-repos) write output")
+    sync.add_argument("--stub-repos", type=int, default=0, metavar="N",
+                      help="run offline against a local stub GraphQL server with N synthetic repos")
+    sync.set_defaults(func=cmd_sync)
+
+    plan = commands.add_parser("plan", help="show the order the next sync would process repos in (read-only)")
+    plan.add_argument("--limit", type=int, default=50, help="number of repos to list")
+    plan.set_defaults(func=cmd_plan)
+
+    status = commands.add_parser("status", help="summarize the local mapping and sync state (no network)")
+    status.set_defaults(func=cmd_status)
+
+    dedupe = commands.add_parser("dedupe", help="delete duplicate 'Repository: <name>' cards from the master project")
+    dedupe.add_argument("--dry-run", action="store_true", help="only list the duplicates")
+    dedupe.set_defaults(func=cmd_dedupe)
+
+    report = commands.add_parser("report", help="render the Markdown/HTML dashboard from the last sync (no network)")
+    report.add_argument("--data", help="report data file written by sync (default: report_data.jsonl)")
+    report.add_argument("--out-dir", default="report", help="where report.md and report.html are written")
+    report.add_argument("--stale-days", type=int, help="days without a push before a repo counts as stale")
+    report.set_defaults(func=cmd_report)
+
+    bench = commands.add_parser("bench", help="time full syncs against the offline stub API")
+    bench.add_argument("--repos", type=int, default=500, help="number of synthetic repos")
+    bench.add_argument("--runs", type=int, default=2, help="consecutive runs (the first one provisions everything)")
+    bench.set_defaults(func=cmd_bench)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Settings for the sync. Values read from the environment are resolved at import time;
+API_URL, MAPPING_FILE and SYNC_STATE_FILE are looked up at call time so the CLI can
+redirect them (e.g. to the offline stub).
+"""
+import os
+
+USERNAME = "Gianpy99"
+MASTER_PROJECT_TITLE = "Master Project"
+MAPPING_FILE = "repo_project_mapping.json"
+SYNC_STATE_FILE = "sync_state.json"
+MASTER_CARD_PREFIX = "Repository: "
+
+# Provisioning: "template" copies every repo board from TEMPLATE_PROJECT_TITLE with one
+# copyProjectV2 mutation; "fields" creates an empty board and adds fields one by one.
+PROVISION_MODE = os.environ.get("PROVISION_MODE", "template")
+TEMPLATE_PROJECT_TITLE = "Repo Project Template"
+
+# Metrics: aggregate counts are fetched for METRICS_BATCH_SIZE repos per request.
+# Each search below becomes an `issueCount` per repo (query is prefixed with repo:<owner>/<name>).
+METRICS_BATCH_SIZE = int(os.environ.get("METRICS_BATCH_SIZE", "25"))
+METRICS_SEARCHES = {
+    "bugs": "is:issue is:open label:bug",
+    "blocked": "is:open label:blocked",
+}
+# Per-column counts need every project item, so they are opt-in.
+METRICS_PER_COLUMN = os.environ.get("METRICS_PER_COLUMN", "").lower() in ("1", "true", "yes")
+
+# Run budget: the sync loop stops cleanly once either limit is spent (0 = no limit).
+# Leftover repos are saved in SYNC_STATE_FILE and go first on the next run.
+RUN_TIME_BUDGET_SECONDS = float(os.environ.get("RUN_TIME_BUDGET_SECONDS", "0"))
+RUN_POINT_BUDGET = int(os.environ.get("RUN_POINT_BUDGET", "0"))
+# Share of both limits kept back from the repo loop for the metrics pass, which also stops
+# (writing what it fetched) once the budget is spent.
+RUN_METRICS_BUDGET_SHARE = float(os.environ.get("RUN_METRICS_BUDGET_SHARE", "0.2"))
+# The mapping and sync state are saved every SYNC_SAVE_EVERY repos and when the loop ends.
+SYNC_SAVE_EVERY = int(os.environ.get("SYNC_SAVE_EVERY", "50"))
+
+# Report: the sync writes one JSON line per repo to REPORT_DATA_FILE; `report` renders it
+# offline. Repos without a push in REPORT_STALE_DAYS are listed as stale.
+REPORT_DATA_FILE = "report_data.jsonl"
+REPORT_STALE_DAYS = int(os.environ.get("REPORT_STALE_DAYS", "30"))
+
+# Identical GraphQL reads share one request and are memoized for the run (see graphql.run_query).
+GRAPHQL_COALESCE = os.environ.get("GRAPHQL_COALESCE", "1").lower() not in ("0", "false", "no")
+
+API_URL = os.environ.get("GITHUB_GRAPHQL_URL", "https://api.github.com/graphql")
+
+FIELDS_TO_CREATE = [
+    {"name": "Status", "color": ["GRAY", "BLUE", "YELLOW", "GREEN", "RED", "ORANGE", "PURPLE"], 
+     "description": ["Backlog", "In Progress", "Review", "Done", "Blocked", "On Hold", "QA"]},
+    {"name": "Priority", "color": ["RED", "ORANGE", "YELLOW", "GREEN"], 
+     "description": ["High", "Medium-High", "Medium", "Low"]},
+    {"name": "Type", "color": ["BLUE", "GREEN", "YELLOW", "RED"], 
+     "description": ["Bug", "Feature", "Chore", "Improvement"]},
+    {"name": "Estimate", "color": ["GRAY"], "type": "NUMBER",
+     "description": ["Story Points Estimate"]},
+    {"name": "Owner", "color": ["GRAY"], "type": "TEXT",
+     "description": ["Assigned User"]},
+    {"name": "Due Date", "color": ["GRAY"], "type": "DATE",
+     "description": ["Deadline"]},
+    {"name": "Sprint", "color": ["GRAY"], "type": "TEXT",
+     "description": ["Sprint Name"]}
+]
+
+COLUMNS = [
+    "MVP / Idea",
+    "PRD / Defined",
+    "Dev / Implementation",
+    "Code Review / QA Prep",
+    "CI/CD / Integration",
+    "Testing / Verification",
+    "Release / Done"
+]
+
+NO_STATUS_COLUMN = "No Status"
+
+COLORS = ["BLUE", "GREEN", "YELLOW", "PURPLE", "PINK", "ORANGE", "RED"]
+
+STATUS_OPTIONS = [
+    {"name": "Backlog", "color": "GRAY", "description": "Task in Backlog"},
+    {"name": "In Progress", "color": "BLUE", "description": "Task in Progress"},
+    {"name": "Review", "color": "YELLOW", "description": "Task under Review"},
+    {"name": "Done", "color": "GREEN", "description": "Completed Task"},
+    {"name": "Blocked", "color": "RED", "description": "Blocked Task"},
+    {"name": "On Hold", "color": "ORANGE", "description": "Task on Hold"},
+    {"name": "QA", "color": "PURPLE", "description": "Quality Assurance"}
+]
@@ -0,0 +1,230 @@
+"""GraphQL transport: authenticated requests, rate-limit accounting and timing."""
+import json
+import os
+import re
+import threading
+import time
+
+from . import config
+from .profiling import record_phase_time
+
+# Requests sent, GraphQL rate-limit points spent and reads served without a request during this run.
+API_USAGE = {"requests": 0, "points": 0, "last_used": None, "coalesced": 0}
+
+# Which connection each mutation changes. A memoized read is dropped when it selects that
+# connection and shares a node ID (from its variables or its result) with the mutation;
+# project creation drops every project listing. Unknown mutations drop everything.
+MUTATION_EFFECTS = {
+    "createProjectV2": "projectsV2(",
+    "copyProjectV2": "projectsV2(",
+    "deleteProjectV2": "projectsV2(",
+    "createProjectV2Field": "fields(",
+    "updateProjectV2Field": "fields(",
+    "deleteProjectV2Field": "fields(",
+    "addProjectV2DraftIssue": "items(",
+    "addProjectV2ItemById": "items(",
+    "deleteProjectV2Item": "items(",
+    "updateProjectV2ItemFieldValue": "items(",
+    "updateProjectV2DraftIssue": "items(",
+}
+OWNER_LEVEL_EFFECTS = {"projectsV2("}
+
+class GraphQLError(Exception):
+    """A response with `errors`; `data` keeps whatever partial data came back with them."""
+
+    def __init__(self, result):
+        super().__init__(f"GraphQL error: {result['errors']}")
+        self.errors = result["errors"]
+        self.data = result.get("data")
+
+_reads_lock = threading.Lock()
+_read_cache = {}  # key -> (normalized query, node IDs, result)
+_in_flight = {}   # key -> _PendingRead
+
+class _PendingRead:
+    def __init__(self, query, ids):
+        self.query = query
+        self.ids = ids
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.invalidated = False
+
+def normalize_query(query):
+    return " ".join(query.split())
+
+def _id_variables(query, variables):
+    """Values of the variables the query declares as ID / [ID]."""
+    ids = set()
+    for name in re.findall(r"\$(\w+)\s*:\s*\[?\s*ID\b", query):
+        value = variables.get(name)
+        if isinstance(value, str):
+            ids.add(value)
+        elif isinstance(value, list):
+            ids.update(v for v in value if isinstance(v, str))
+    return ids
+
+def _result_ids(value, ids):
+    """Collects every "id" in a response, so reads can be matched to the nodes they returned."""
+    if isinstance(value, dict):
+        node_id = value.get("id")
+        if isinstance(node_id, str):
+            ids.add(node_id)
+        for child in value.values():
+            _result_ids(child, ids)
+    elif isinstance(value, list):
+        for child in value:
+            _result_ids(child, ids)
+    return ids
+
+def clear_read_cache():
+    with _reads_lock:
+        _read_cache.clear()
+
+def invalidate_reads(mutation, variables):
+    """
+    Drops memoized and in-flight reads affected by `mutation`. An in-flight read still answers
+    the callers already waiting on it, but is not memoized and no later caller joins it.
+    """
+    ids = _id_variables(mutation, variables)
+    fields = re.findall(r"(?:\w+\s*:\s*)?(\w+)\s*\(\s*input\s*:", mutation)
+    effects = [MUTATION_EFFECTS.get(f) for f in fields]
+
+    def affected(query, read_ids):
+        for effect in effects:
+            if effect is None:
+                return True
+            if effect in query and (effect in OWNER_LEVEL_EFFECTS or ids & read_ids):
+                return True
+        return False
+
+    with _reads_lock:
+        for key in [k for k, (q, read_ids, _) in _read_cache.items() if affected(q, read_ids)]:
+            del _read_cache[key]
+        for key, pending in list(_in_flight.items()):
+            if affected(pending.query, pending.ids):
+                pending.invalidated = True
+                del _in_flight[key]
+
+def run_query(query, variables=None, memoize=True):
+    """
+    Runs a GraphQL query. Identical reads (same normalized query and variables) are coalesced:
+    concurrent callers share one request and later callers get the memoized result for the
+    rest of the run, so treat results as read-only. Pass memoize=False for reads that are
+    never repeated (pages of large listings, metrics batches) so they don't pile up in memory;
+    they are still shared while in flight. Mutations invalidate the reads they affect, even
+    when they fail part-way. Set GRAPHQL_COALESCE=0 to send every read.
+    """
+    variables = variables or {}
+    normalized = normalize_query(query)
+    if normalized.startswith("mutation"):
+        try:
+            return _send_query(query, variables)
+        finally:
+            # An aliased batch can fail after some of its writes went through
+            invalidate_reads(normalized, variables)
+    if not config.GRAPHQL_COALESCE:
+        return _send_query(query, variables)
+
+    key = normalized + "\n" + json.dumps(variables, sort_keys=True)
+    with _reads_lock:
+        cached = _read_cache.get(key)
+        if cached is not None:
+            API_USAGE["coalesced"] += 1
+            return cached[2]
+        pending = _in_flight.get(key)
+        leader = pending is None
+        if leader:
+            pending = _in_flight[key] = _PendingRead(normalized, _id_variables(normalized, variables))
+        else:
+            API_USAGE["coalesced"] += 1
+
+    if not leader:
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    try:
+        pending.result = _send_query(query, variables)
+    except BaseException as e:
+        pending.error = e
+        raise
+    finally:
+        with _reads_lock:
+            if _in_flight.get(key) is pending:
+                del _in_flight[key]
+            if memoize and pending.error is None and not pending.invalidated:
+                ids = _result_ids(pending.result, set(pending.ids))
+                _read_cache[key] = (normalized, ids, pending.result)
+        pending.done.set()
+    return pending.result
+
+def _send_query(query, variables):
+    """Esegue una query GraphQL con autenticazione."""
+    # The auth probe accepts GITHUB_TOKEN as a fallback, so requests do too
+    token = os.getenv('MASTER_PROJECT_ID') or os.getenv('GITHUB_TOKEN')
+    if not token:
+        raise Exception("MASTER_PROJECT_ID environment variable not set")
+    
+    # Clean any whitespace from token
+    token = token.strip()
+    
+    headers = {"Authorization": f"Bearer {token}"}
+    json_data = {"query": query, "variables": variables}
+    response = post_graphql(json_data, headers)
+    
+    # Debug: print response status and content if there's an issue
+    if response.status_code != 200:
+        print(f"[ERROR] HTTP {response.status_code}: {response.text}")
+        raise Exception(f"HTTP error {response.status_code}: {response.text}")
+    
+    result = decode_json(response)
+    
+    # Debug: print the full response if there's no 'data' key
+    if "data" not in result:
+        print(f"[ERROR] Response missing 'data' key: {result}")
+    
+    if "errors" in result:
+        raise GraphQLError(result)
+    return result
+
+def post_graphql(json_data, headers):
+    """
+    Sends one GraphQL request, recording rate-limit usage and network wait for the current phase.
+    Network wait is the wall time of the call minus this thread's CPU time inside it, so other
+    threads' CPU (e.g. concurrent readers) doesn't count against the wait.
+    """
+    import requests
+
+    wall, cpu = time.perf_counter(), time.thread_time()
+    response = requests.post(config.API_URL, json=json_data, headers=headers)
+    record_phase_time("network", (time.perf_counter() - wall) - (time.thread_time() - cpu))
+    record_phase_time("requests", 1)
+    record_api_usage(response.headers)
+    return response
+
+def decode_json(response):
+    started = time.perf_counter()
+    result = response.json()
+    record_phase_time("decode", time.perf_counter() - started)
+    return result
+
+def record_api_usage(headers):
+    """
+    Tracks requests and rate-limit points from the X-RateLimit-Used header.
+    Falls back to one point per request when the header is missing or the window reset.
+    """
+    API_USAGE["requests"] += 1
+    try:
+        used = int(headers.get("X-RateLimit-Used"))
+    except (TypeError, ValueError):
+        API_USAGE["points"] += 1
+        return
+
+    last_used = API_USAGE["last_used"]
+    if last_used is None or used <= last_used:
+        API_USAGE["points"] += 1
+    else:
+        API_USAGE["points"] += used - last_used
+    API_USAGE["last_used"] = used
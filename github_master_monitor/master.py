@@ -0,0 +1,211 @@
+"""Master Project cards: one draft issue per repo."""
+from .config import COLUMNS, MASTER_CARD_PREFIX, METRICS_SEARCHES, NO_STATUS_COLUMN
+from .graphql import run_query
+from .projects import create_status_field, get_project_field_nodes, get_project_items, iter_project_items
+
+def add_repo_to_master_project(master_project_id, repo_id, repo_name, status="Backlog"):
+    """
+    Adds a repository as a project item to the master project.
+    Since repositories can't be added directly as items, we create a draft issue instead.
+    Returns the draft issue ID, the same ID find_master_cards() maps repo names to.
+    """
+    print(f"[DEBUG] Adding repo {repo_name} to master project {master_project_id}")
+    
+    # Create a draft issue to represent the repository
+    mutation_draft = """
+    mutation($projectId: ID!, $title: String!, $body: String!) {
+      addProjectV2DraftIssue(input: {
+        projectId: $projectId,
+        title: $title,
+        body: $body
+      }) {
+        projectItem {
+          id
+          content { ... on DraftIssue { id } }
+        }
+      }
+    }
+    """
+    
+    draft_title = f"{MASTER_CARD_PREFIX}{repo_name}"
+    draft_body = build_card_body(repo_name)
+    
+    try:
+        result = run_query(mutation_draft, {
+            "projectId": master_project_id,
+            "title": draft_title,
+            "body": draft_body
+        })
+        
+        project_item = result["data"]["addProjectV2DraftIssue"]["projectItem"]
+        item_id = project_item["id"]
+        draft_issue_id = project_item["content"]["id"]
+        print(f"[DEBUG] Created draft issue with item_id: {item_id}")
+
+        # Set the status field - with error handling
+        print(f"[DEBUG] Getting master project fields with options...")
+        
+        # Get fields with options for SingleSelect fields
+        fields = get_project_field_nodes(master_project_id)
+        
+        print(f"[DEBUG] Raw fields with options: {fields}")
+        
+        # Find the Custom Status field and its options
+        custom_status_field_id = None
+        status_options = {}
+        
+        for field in fields:
+            if (field.get("__typename") == "ProjectV2SingleSelectField" and 
+                field.get("name") == "Custom Status"):
+                custom_status_field_id = field["id"]
+                if "options" in field:
+                    for option in field["options"]:
+                        status_options[option["name"]] = option["id"]
+                break
+        
+        print(f"[DEBUG] Custom Status field ID: {custom_status_field_id}")
+        print(f"[DEBUG] Available status options: {status_options}")
+        
+        if custom_status_field_id and status_options:
+            # Try to find the requested status, fall back to first available option
+            status_option_id = None
+            if status in status_options:
+                status_option_id = status_options[status]
+                print(f"[DEBUG] Found exact match for status '{status}': {status_option_id}")
+            elif status_options:
+                # Fall back to first available option
+                first_option = list(status_options.keys())[0]
+                status_option_id = status_options[first_option]
+                print(f"[WARNING] Status '{status}' not found, using '{first_option}' instead")
+            
+            if status_option_id:
+                mutation_status = """
+                mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $optionId: String!) {
+                  updateProjectV2ItemFieldValue(input: {
+                    projectId: $projectId,
+                    itemId: $itemId,
+                    fieldId: $fieldId,
+                    value: { singleSelectOptionId: $optionId }
+                  }) {
+                    projectV2Item { id }
+                  }
+                }
+                """
+                
+                try:
+                    run_query(mutation_status, {
+                        "projectId": master_project_id,
+                        "itemId": item_id,
+                        "fieldId": custom_status_field_id,
+                        "optionId": status_option_id
+                    })
+                    actual_status = next(name for name, id in status_options.items() if id == status_option_id)
+                    print(f"[DEBUG] Successfully set Custom Status to '{actual_status}'")
+                except Exception as status_error:
+                    print(f"[WARNING] Failed to set Custom Status field: {status_error}")
+            else:
+                print(f"[WARNING] No valid status option ID found")
+        else:
+            print(f"[WARNING] No Custom Status field found or no options available")
+            print(f"[INFO] Creating Custom Status field for master project...")
+            create_status_field(master_project_id)
+
+        print(f"[SYNC] Added repo {repo_name} to Master project")
+        return draft_issue_id
+        
+    except Exception as e:
+        print(f"[ERROR] Failed to add repo {repo_name} to master project: {e}")
+        import traceback
+        print(f"[ERROR] Full traceback: {traceback.format_exc()}")
+        raise
+
+def check_repo_in_master(master_project_id, repo_name):
+    """
+    Check if a repository (represented as a draft issue) already exists in the master project.
+    """
+    return repo_name in find_master_cards(master_project_id)
+
+def find_master_cards(master_project_id):
+    """
+    Maps repo name -> draft issue ID for every 'Repository: <name>' card in the master project.
+    """
+    cards = {}
+    for item in get_project_items(master_project_id):
+        if item.get("content_type") != "DraftIssue":
+            continue
+        title = item.get("title") or ""
+        if title.startswith(MASTER_CARD_PREFIX):
+            cards.setdefault(title[len(MASTER_CARD_PREFIX):].strip(), item["content_id"])
+    return cards
+
+def ordered_columns(columns):
+    """
+    Status names from per-column counts in display order: the 7 COLUMNS, then any other
+    statuses the board uses (e.g. GitHub's default Todo/In Progress/Done), then "No Status".
+    """
+    others = sorted(c for c in columns if c not in COLUMNS and c != NO_STATUS_COLUMN)
+    tail = [NO_STATUS_COLUMN] if NO_STATUS_COLUMN in columns else []
+    return [c for c in COLUMNS if c in columns] + others + tail
+
+def build_card_body(repo_name, metrics=None):
+    """
+    Builds the master card body, optionally followed by the repo's metrics block.
+    """
+    body = f"This item represents the repository {repo_name} for project tracking purposes."
+    if not metrics:
+        return body
+
+    lines = [
+        "",
+        "",
+        "**Metrics**",
+        f"- Open issues: {metrics.get('open_issues', 0)}",
+        f"- Open pull requests: {metrics.get('open_pull_requests', 0)}",
+        f"- Total pull requests: {metrics.get('pull_requests', 0)}",
+    ]
+    for key in METRICS_SEARCHES:
+        lines.append(f"- {key.replace('_', ' ').capitalize()}: {metrics.get(key, 0)}")
+
+    columns = metrics.get("columns")
+    if columns:
+        lines.append("")
+        lines.append("**Issues per column**")
+        for column in ordered_columns(columns):
+            lines.append(f"- {column}: {columns[column]}")
+    return body + "\n".join(lines)
+
+def find_duplicate_master_cards(master_project_id):
+    """
+    Maps repo name -> item IDs of the extra 'Repository: <name>' cards; the first card per repo is kept.
+    """
+    seen = set()
+    duplicates = {}
+    for item in iter_project_items(master_project_id):
+        title = item.get("title") or ""
+        if item.get("content_type") != "DraftIssue" or not title.startswith(MASTER_CARD_PREFIX):
+            continue
+        repo_name = title[len(MASTER_CARD_PREFIX):].strip()
+        if repo_name in seen:
+            duplicates.setdefault(repo_name, []).append(item["item_id"])
+        else:
+            seen.add(repo_name)
+    return duplicates
+
+def delete_project_items(project_id, item_ids, batch_size=25):
+    """
+    Deletes project items with aliased deleteProjectV2Item mutations, one request per batch.
+    """
+    for start in range(0, len(item_ids), batch_size):
+        batch = item_ids[start:start + batch_size]
+        params = ["$projectId: ID!"]
+        variables = {"projectId": project_id}
+        selections = []
+        for i, item_id in enumerate(batch):
+            params.append(f"$item{i}: ID!")
+            variables[f"item{i}"] = item_id
+            selections.append(f"""
+      d{i}: deleteProjectV2Item(input: {{projectId: $projectId, itemId: $item{i}}}) {{
+        deletedItemId
+      }}""")
+        mutation = f"mutation({', '.join(params)}) {{{''.join(selections)}\n    }}"
+        run_query(mutation, variables)
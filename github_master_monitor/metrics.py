@@ -0,0 +1,142 @@
+"""Per-repo metrics from aggregate counts, written to the master cards."""
+from .config import METRICS_BATCH_SIZE, METRICS_PER_COLUMN, METRICS_SEARCHES, NO_STATUS_COLUMN
+from .graphql import GraphQLError, run_query
+from .master import build_card_body, find_master_cards
+from .projects import get_project_items
+
+def build_repo_metrics_query(owner, repo_names):
+    """
+    Builds a single aliased query that reads aggregate counts for a batch of repos.
+    Returns (query, variables); repo i is aliased as r<i> and its searches as r<i>_<key>.
+    """
+    params = ["$owner: String!"]
+    variables = {"owner": owner}
+    selections = []
+
+    for i, repo_name in enumerate(repo_names):
+        params.append(f"$name{i}: String!")
+        variables[f"name{i}"] = repo_name
+        selections.append(f"""
+      r{i}: repository(owner: $owner, name: $name{i}) {{
+        openIssues: issues(states: OPEN) {{ totalCount }}
+        openPullRequests: pullRequests(states: OPEN) {{ totalCount }}
+        pullRequests {{ totalCount }}
+      }}""")
+        for key, search in METRICS_SEARCHES.items():
+            params.append(f"$q{i}_{key}: String!")
+            variables[f"q{i}_{key}"] = f"repo:{owner}/{repo_name} {search}"
+            selections.append(f"""
+      r{i}_{key}: search(query: $q{i}_{key}, type: ISSUE) {{ issueCount }}""")
+
+    query = f"query({', '.join(params)}) {{{''.join(selections)}\n    }}"
+    return query, variables
+
+def fetch_repo_metrics(owner, repo_names, batch_size=None, budget=None):
+    """
+    Fetches aggregate issue/PR counts for many repos, one request per batch.
+    Costs O(repos / batch size) requests, independent of how many items the repos hold.
+    Repos that no longer resolve (NOT_FOUND) are skipped with a warning.
+    Stops early once `budget` (a RunBudget) is spent.
+    """
+    batch_size = batch_size or METRICS_BATCH_SIZE
+    metrics = {}
+
+    for start in range(0, len(repo_names), batch_size):
+        if budget and budget.exhausted():
+            print(f"[INFO] Run budget spent; metrics fetched for {len(metrics)}/{len(repo_names)} repos")
+            break
+        batch = repo_names[start:start + batch_size]
+        query, variables = build_repo_metrics_query(owner, batch)
+        try:
+            data = run_query(query, variables, memoize=False)["data"]
+        except GraphQLError as e:
+            # A repo renamed/deleted since discovery fails only its own alias; keep the rest
+            if not e.data or any(error.get("type") != "NOT_FOUND" for error in e.errors):
+                raise
+            data = e.data
+
+        for i, repo_name in enumerate(batch):
+            repo = data.get(f"r{i}")
+            if not repo:
+                print(f"[WARNING] No metrics returned for repo {repo_name}")
+                continue
+            repo_metrics = {
+                "open_issues": repo["openIssues"]["totalCount"],
+                "open_pull_requests": repo["openPullRequests"]["totalCount"],
+                "pull_requests": repo["pullRequests"]["totalCount"],
+            }
+            for key in METRICS_SEARCHES:
+                search = data.get(f"r{i}_{key}") or {}
+                repo_metrics[key] = search.get("issueCount", 0)
+            metrics[repo_name] = repo_metrics
+
+        print(f"[INFO] Fetched metrics for {len(batch)} repos ({start + len(batch)}/{len(repo_names)})")
+
+    return metrics
+
+def count_items_per_column(project_id):
+    """
+    Counts a repo project's items per Status column.
+    This enumerates every item, so it only runs when METRICS_PER_COLUMN is enabled.
+    """
+    counts = {}
+    for item in get_project_items(project_id):
+        column = item.get("status") or NO_STATUS_COLUMN
+        counts[column] = counts.get(column, 0) + 1
+    return counts
+
+def update_master_card_bodies(bodies, batch_size=None):
+    """
+    Writes card bodies (draft issue ID -> body) using aliased updateProjectV2DraftIssue mutations,
+    one request per batch.
+    """
+    batch_size = batch_size or METRICS_BATCH_SIZE
+    items = list(bodies.items())
+
+    for start in range(0, len(items), batch_size):
+        batch = items[start:start + batch_size]
+        params = []
+        variables = {}
+        selections = []
+        for i, (draft_issue_id, body) in enumerate(batch):
+            params.append(f"$id{i}: ID!, $body{i}: String!")
+            variables[f"id{i}"] = draft_issue_id
+            variables[f"body{i}"] = body
+            selections.append(f"""
+      c{i}: updateProjectV2DraftIssue(input: {{draftIssueId: $id{i}, body: $body{i}}}) {{
+        draftIssue {{ id }}
+      }}""")
+        mutation = f"mutation({', '.join(params)}) {{{''.join(selections)}\n    }}"
+        run_query(mutation, variables)
+
+def sync_master_metrics(master_project_id, owner, repo_names, repo_projects=None, cards=None, budget=None):
+    """
+    Fetches per-repo counts and writes them to the matching master cards.
+    Per-column counts are added only when METRICS_PER_COLUMN is enabled.
+    `cards` (repo name -> draft issue ID) saves listing the master project again. Fetching
+    stops once `budget` is spent; whatever was fetched is still written.
+    """
+    metrics = fetch_repo_metrics(owner, repo_names, budget=budget)
+
+    if METRICS_PER_COLUMN and repo_projects:
+        for repo_name, repo_metrics in metrics.items():
+            if budget and budget.exhausted():
+                print("[INFO] Run budget spent; skipping the remaining per-column counts")
+                break
+            project_id = repo_projects.get(repo_name)
+            if project_id:
+                repo_metrics["columns"] = count_items_per_column(project_id)
+
+    if cards is None:
+        cards = find_master_cards(master_project_id)
+    bodies = {}
+    for repo_name, repo_metrics in metrics.items():
+        draft_issue_id = cards.get(repo_name)
+        if not draft_issue_id:
+            print(f"[WARNING] No master card found for repo {repo_name}, skipping metrics")
+            continue
+        bodies[draft_issue_id] = build_card_body(repo_name, repo_metrics)
+
+    update_master_card_bodies(bodies)
+    print(f"[INFO] Updated metrics on {len(bodies)} master cards")
+    return metrics
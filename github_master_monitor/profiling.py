@@ -0,0 +1,159 @@
+"""Per-phase timers, cProfile output and collapsed stacks for flamegraphs."""
+import os
+import time
+from contextlib import contextmanager
+
+# Per-phase totals. Phases are exclusive: entering a nested phase pauses the outer one,
+# so the wall times add up to the whole run. CPU is the sync thread's own (time.thread_time).
+PHASE_STATS = {}
+_phase_stack = []
+
+def _phase_entry(name):
+    return PHASE_STATS.setdefault(name, {"wall": 0.0, "cpu": 0.0, "network": 0.0, "decode": 0.0, "requests": 0})
+
+def _flush_phase():
+    if _phase_stack:
+        name, wall, cpu = _phase_stack[-1]
+        stats = _phase_entry(name)
+        stats["wall"] += time.perf_counter() - wall
+        stats["cpu"] += time.thread_time() - cpu
+
+@contextmanager
+def phase(name):
+    _flush_phase()
+    _phase_stack.append((name, time.perf_counter(), time.thread_time()))
+    try:
+        yield
+    finally:
+        _flush_phase()
+        _phase_stack.pop()
+        if _phase_stack:
+            _phase_stack[-1] = (_phase_stack[-1][0], time.perf_counter(), time.thread_time())
+
+def start_phase(name):
+    """Ends the current top-level phase and starts `name` (used for the sequential steps of main)."""
+    _flush_phase()
+    entry = (name, time.perf_counter(), time.thread_time())
+    if _phase_stack:
+        _phase_stack[-1] = entry
+    else:
+        _phase_stack.append(entry)
+
+def end_phases():
+    while _phase_stack:
+        _flush_phase()
+        _phase_stack.pop()
+
+def record_phase_time(key, amount):
+    _phase_entry(_phase_stack[-1][0] if _phase_stack else "other")[key] += amount
+
+def format_phase_report():
+    lines = [f"{'phase':<16}{'wall s':>10}{'cpu s':>10}{'net wait s':>12}{'decode s':>10}{'requests':>10}"]
+    for name, stats in PHASE_STATS.items():
+        lines.append(f"{name:<16}{stats['wall']:>10.3f}{stats['cpu']:>10.3f}{stats['network']:>12.3f}"
+                     f"{stats['decode']:>10.3f}{stats['requests']:>10}")
+    return "\n".join(lines)
+
+def collapsed_stacks(profiler, min_seconds=0.0005):
+    """
+    Collapsed stacks (stack -> own microseconds) for flamegraphs, rebuilt from a cProfile run's
+    call graph rather than a second, live profiler. The time a function gets on a path is split
+    between its own time and its callees in proportion to the profile, so every path adds up
+    to its root's total. Calls back into the path (recursion) are already inside it and are
+    skipped; branches under `min_seconds` are folded into their parent.
+    """
+    import pstats
+
+    stats = pstats.Stats(profiler).stats
+    callees = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+
+    def label(func):
+        filename, line, name = func
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    counts = {}
+
+    def walk(func, seconds, path):
+        own = stats[func][2]
+        path = path + [label(func)]
+        children = [(callee, edge) for callee, edge in callees.get(func, ()) if label(callee) not in path]
+        total = own + sum(edge for _, edge in children)
+        share = seconds / total if total else 0.0
+        folded = own * share
+        for callee, edge in children:
+            callee_seconds = edge * share
+            if callee_seconds >= min_seconds:
+                walk(callee, callee_seconds, path)
+            else:
+                folded += callee_seconds
+        key = ";".join(path)
+        counts[key] = counts.get(key, 0.0) + folded
+
+    for func, (_, _, _, cumulative, callers) in stats.items():
+        if not callers:
+            walk(func, cumulative, [])
+    return {stack: round(seconds * 1e6) for stack, seconds in counts.items() if seconds * 1e6 >= 1}
+
+def format_hot_functions(profiler, limit=25):
+    """
+    Cumulative/own time per helper defined in this package, from a cProfile run.
+    """
+    import pstats
+
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    rows = []
+    for (filename, line, func), (_, calls, own, cumulative, _) in pstats.Stats(profiler).stats.items():
+        if os.path.dirname(os.path.abspath(filename)) == package_dir:
+            rows.append((cumulative, own, calls, f"{func} ({os.path.basename(filename)}:{line})"))
+    rows.sort(reverse=True)
+
+    lines = [f"{'cumulative s':>13}{'own s':>10}{'calls':>9}  function"]
+    for cumulative, own, calls, name in rows[:limit]:
+        lines.append(f"{cumulative:>13.3f}{own:>10.3f}{calls:>9}  {name}")
+    return "\n".join(lines)
+
+def write_reports(profile_dir, reports):
+    os.makedirs(profile_dir, exist_ok=True)
+    for filename, report in reports.items():
+        with open(os.path.join(profile_dir, filename), "w") as f:
+            f.write(report + "\n")
+        print(f"\n[PROFILE] {filename}\n{report}")
+
+def run_timed(func, profile_dir):
+    """
+    Runs `func` with only the phase timers (no profiler attached) and writes phases.txt
+    to `profile_dir`. Returns what `func` returns.
+    """
+    try:
+        return func()
+    finally:
+        end_phases()
+        write_reports(profile_dir, {"phases.txt": format_phase_report()})
+
+def run_profiled(func, profile_dir):
+    """
+    Runs `func` under cProfile, then writes to `profile_dir`: run.prof (cProfile dump),
+    run.collapsed (flamegraph input), hot_functions.txt and phases.txt. cProfile's tracing is
+    charged to the phases' CPU; use run_timed() for uninstrumented phase timings.
+    Returns what `func` returns.
+    """
+    import cProfile
+
+    os.makedirs(profile_dir, exist_ok=True)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return func()
+    finally:
+        profiler.disable()
+        end_phases()
+
+        profiler.dump_stats(os.path.join(profile_dir, "run.prof"))
+        with open(os.path.join(profile_dir, "run.collapsed"), "w") as f:
+            for stack, micros in sorted(collapsed_stacks(profiler).items()):
+                f.write(f"{stack} {micros}\n")
+        write_reports(profile_dir, {"phases.txt": format_phase_report(), "hot_functions.txt": format_hot_functions(profiler)})
+        print(f"\n[PROFILE] Wrote run.prof and run.collapsed to {profile_dir}/")
@@ -0,0 +1,334 @@
+"""ProjectV2 listing, creation, fields and items."""
+from .config import USERNAME
+from .graphql import run_query
+
+# One fields query for every caller (Custom Status checks, field syncs, master card status),
+# so repeated reads of the same project coalesce into one request.
+PROJECT_FIELDS_QUERY = """
+query($projectId: ID!) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      fields(first: 50) {
+        nodes {
+          __typename
+          ... on ProjectV2FieldCommon {
+            id
+            name
+            dataType
+          }
+          ... on ProjectV2SingleSelectField {
+            options {
+              id
+              name
+              color
+              description
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+def get_project_field_nodes(project_id: str):
+    """Returns the raw field nodes of a project (see PROJECT_FIELDS_QUERY)."""
+    return run_query(PROJECT_FIELDS_QUERY, {"projectId": project_id})["data"]["node"]["fields"]["nodes"]
+
+def get_projects_for_owner(owner_login):
+    query = """
+    query($login: String!, $cursor: String) {
+      user(login: $login) {
+        projectsV2(first: 100, after: $cursor) {
+          nodes { id title }
+          pageInfo { hasNextPage endCursor }
+        }
+      }
+    }
+    """
+    projects = []
+    cursor = None
+    while True:
+        page = run_query(query, {"login": owner_login, "cursor": cursor})["data"]["user"]["projectsV2"]
+        projects.extend(page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            return projects
+        cursor = page["pageInfo"]["endCursor"]
+
+def index_projects_by_title(projects):
+    """Maps project title -> ID; the first project wins when titles repeat."""
+    by_title = {}
+    for p in projects:
+        by_title.setdefault(p["title"], p["id"])
+    return by_title
+
+def get_projects_for_repo(owner, repo_name):
+    query = """
+    query($owner: String!, $repo: String!) {
+      repository(owner: $owner, name: $repo) {
+        projectsV2(first: 10) { nodes { id title } }
+      }
+    }
+    """
+    return run_query(query, {"owner": owner, "repo": repo_name})["data"]["repository"]["projectsV2"]["nodes"]
+
+def create_project(owner_id, title):
+    mutation = """
+    mutation($ownerId: ID!, $title: String!) {
+      createProjectV2(input: {ownerId: $ownerId, title: $title}) {
+        projectV2 { id title }
+      }
+    }
+    """
+    return run_query(mutation, {"ownerId": owner_id, "title": title})["data"]["createProjectV2"]["projectV2"]["id"]
+
+def create_project_if_missing(owner_id, repo_name, owner_login=USERNAME):
+    # 1. Lista progetti giÃ  esistenti nell'owner (stessa query di get_projects_for_owner)
+    existing_projects = get_projects_for_owner(owner_login)
+
+    # 2. Se giÃ  esiste con quel nome â†' riusa
+    for p in existing_projects:
+        if p["title"] == f"{repo_name} Project":
+            return p["id"]
+
+    # 3. Se non c'Ã¨ â†' crealo
+    mutation = """
+    mutation($ownerId: ID!, $title: String!) {
+      createProjectV2(input: {ownerId: $ownerId, title: $title}) {
+        projectV2 {
+          id
+          title
+        }
+      }
+    }
+    """
+    result = run_query(mutation, {"ownerId": owner_id, "title": f"{repo_name} Project"})
+    return result["data"]["createProjectV2"]["projectV2"]["id"]
+
+def create_status_field(project_id: str):
+    """
+    Creates a 'Custom Status' SINGLE_SELECT field in the GitHub project with custom options.
+    """
+    desired_options = [
+        {"name": "Backlog", "color": "GRAY", "description": "Task in Backlog"},
+        {"name": "In Progress", "color": "BLUE", "description": "Task in Progress"},
+        {"name": "Review", "color": "YELLOW", "description": "Task under Review"},
+        {"name": "Done", "color": "GREEN", "description": "Completed Task"},
+        {"name": "Blocked", "color": "RED", "description": "Blocked Task"},
+        {"name": "On Hold", "color": "ORANGE", "description": "Task on Hold"},
+        {"name": "QA", "color": "PURPLE", "description": "Quality Assurance"}
+    ]
+
+    # Check if Custom Status field already exists
+    existing_fields = get_project_field_nodes(project_id)
+
+    # Check if Custom Status field already exists
+    for field in existing_fields:
+        if field.get("__typename") == "ProjectV2SingleSelectField" and field.get("name") == "Custom Status":
+            print(f"[INFO] Custom Status field already exists with ID: {field['id']}")
+            existing_options = [opt["name"] for opt in field.get("options", [])]
+            print(f"[INFO] Existing Custom Status options: {existing_options}")
+            return field["id"]
+    
+    # Create new Custom Status field
+    print(f"[INFO] Creating new 'Custom Status' field with desired options...")
+    mutation = """
+    mutation($projectId: ID!, $options: [ProjectV2SingleSelectFieldOptionInput!]!) {
+      createProjectV2Field(input: {
+        projectId: $projectId,
+        name: "Custom Status",
+        dataType: SINGLE_SELECT,
+        singleSelectOptions: $options
+      }) {
+        projectV2Field {
+          ... on ProjectV2SingleSelectField {
+            id
+            name
+            options {
+              id
+              name
+            }
+          }
+        }
+      }
+    }
+    """
+    
+    try:
+        result = run_query(mutation, {"projectId": project_id, "options": desired_options})
+        field = result["data"]["createProjectV2Field"]["projectV2Field"]
+        field_id = field["id"]
+        print(f"[INFO] Created 'Custom Status' field with ID {field_id}")
+        print(f"[INFO] Available options: {[opt['name'] for opt in field.get('options', [])]}")
+        return field_id
+    except Exception as e:
+        print(f"[ERROR] Failed to create Custom Status field: {e}")
+        return None
+
+def get_project_items(project_id: str):
+    """
+    Recupera tutti gli item di un ProjectV2 (vedi iter_project_items).
+    """
+    return list(iter_project_items(project_id))
+
+def iter_project_items(project_id: str):
+    """
+    Itera tutti gli item di un ProjectV2, una pagina da 100 alla volta, gestendo correttamente
+    i diversi tipi di contenuto (Issue, PullRequest, DraftIssue) e leggendo i campi SINGLE_SELECT come Status.
+    """
+    query = """
+    query($id: ID!, $cursor: String) {
+      node(id: $id) {
+        ... on ProjectV2 {
+          items(first: 100, after: $cursor) {
+            pageInfo { hasNextPage endCursor }
+            nodes {
+              id
+              content {
+                __typename
+                ... on Issue {
+                  id
+                  title
+                  repository {
+                    id
+                    name
+                  }
+                }
+                ... on PullRequest {
+                  id
+                  title
+                  repository {
+                    id
+                    name
+                  }
+                }
+                ... on DraftIssue {
+                  id
+                  title
+                }
+              }
+              fieldValues(first: 10) {
+                nodes {
+                  __typename
+                  ... on ProjectV2ItemFieldSingleSelectValue {
+                    field {
+                      __typename
+                      ... on ProjectV2SingleSelectField {
+                        id
+                        name
+                      }
+                    }
+                    name
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+    """
+    cursor = None
+    while True:
+        result = run_query(query, {"id": project_id, "cursor": cursor}, memoize=False)
+        page = result.get("data", {}).get("node", {}).get("items", {})
+        yield from _parse_project_items(page.get("nodes", []))
+        if not page.get("pageInfo", {}).get("hasNextPage"):
+            return
+        cursor = page["pageInfo"]["endCursor"]
+
+def _parse_project_items(nodes):
+    items_list = []
+    for item in nodes:
+        content = item.get("content")
+        content_id = None
+        repo_id = None
+        
+        if content:
+            content_type = content.get("__typename")
+            content_id = content.get("id")
+            
+            # For Issues and PullRequests, get the repository ID
+            if content_type in ["Issue", "PullRequest"] and "repository" in content:
+                repo_id = content["repository"]["id"]
+
+        status = None
+        for fv in item.get("fieldValues", {}).get("nodes", []):
+            if fv.get("__typename") != "ProjectV2ItemFieldSingleSelectValue":
+                continue
+            field = fv.get("field")
+            if not field or field.get("__typename") != "ProjectV2SingleSelectField":
+                continue
+            if field.get("name") == "Status":
+                status = fv.get("name")
+
+        items_list.append({
+            "item_id": item["id"],
+            "content_id": content_id,
+            "content_type": content.get("__typename") if content else None,
+            "title": content.get("title") if content else None,
+            "repo_id": repo_id,
+            "status": status
+        })
+
+    return items_list
+
+def sync_project_fields(project_id: str):
+    """
+    Sync required fields into the project.
+    Currently ensures 'Custom Status' exists.
+    """
+    nodes = get_project_field_nodes(project_id)
+    existing_fields = [f["name"] for f in nodes if "name" in f]
+    
+    print(f"[INFO] Existing fields: {existing_fields}")
+
+    if "Custom Status" not in existing_fields:
+        print(f"[INFO] Creating missing 'Custom Status' field for project {project_id}")
+        create_status_field(project_id)
+    else:
+        print(f"[INFO] 'Custom Status' field already exists for project {project_id}")
+
+def get_project_fields(project_id):
+    """
+    Get project fields mapping with comprehensive field type support and error handling.
+    """
+    try:
+        result = run_query(PROJECT_FIELDS_QUERY, {"projectId": project_id})
+        
+        if "errors" in result:
+            print(f"[ERROR] GraphQL errors getting fields for {project_id}: {result['errors']}")
+            return {}
+            
+        if not result.get("data") or not result["data"].get("node"):
+            print(f"[ERROR] Invalid response structure for project {project_id}: {result}")
+            return {}
+            
+        fields = result["data"]["node"]["fields"]["nodes"]
+        
+        # Debug: print the fields structure to understand what we're getting
+        print(f"[DEBUG] Raw fields from project {project_id}: {fields}")
+        
+        # Filter out fields that don't have both name and id - be extra safe
+        field_mapping = {}
+        for field in fields:
+            try:
+                if (isinstance(field, dict) and 
+                    field.get("name") is not None and 
+                    field.get("id") is not None and
+                    len(str(field.get("name")).strip()) > 0):
+                    field_mapping[field["name"]] = field["id"]
+                else:
+                    print(f"[DEBUG] Skipping field without valid name/id: {field}")
+            except Exception as field_error:
+                print(f"[DEBUG] Error processing field {field}: {field_error}")
+                continue
+        
+        print(f"[DEBUG] Final field mapping for {project_id}: {field_mapping}")
+        return field_mapping
+        
+    except Exception as e:
+        print(f"[ERROR] Failed to get project fields for {project_id}: {e}")
+        import traceback
+        print(f"[ERROR] Full traceback: {traceback.format_exc()}")
+        return {}
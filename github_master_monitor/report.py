@@ -0,0 +1,250 @@
+"""
+Static Markdown/HTML dashboard built from the report data the sync writes.
+
+The data file is read one record at a time and the output is written one chunk of
+REPORT_CHUNK_SIZE repos at a time, so memory stays flat however many repos there are.
+Rendered chunks are cached by content hash; unchanged chunks are copied, not re-rendered.
+"""
+import hashlib
+import html
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+from . import config
+from .config import COLUMNS, NO_STATUS_COLUMN
+
+REPORT_CHUNK_SIZE = 100
+# Bump when the rendered layout changes so cached chunks are re-rendered.
+RENDER_VERSION = 2
+
+HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: right; }}
+th:first-child, td:first-child {{ text-align: left; }}
+.missing {{ color: #b00; }}
+.stale {{ color: #888; }}
+</style>
+</head>
+<body>
+"""
+
+# --------------------
+# REPORT DATA (written by the sync)
+# --------------------
+def iter_report_records(path):
+    """Yields one repo record per line of a report data file; nothing if it doesn't exist."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def write_report_data(repos, mapping, state, metrics):
+    """
+    Writes one JSON line per repo: activity, board, last sync and metrics.
+    Fresh metrics are layered over the previous data file's, so repos not reached this run
+    (or whose per-column counts the budget cut) keep their last known values.
+    """
+    previous = {}
+    for record in iter_report_records(config.REPORT_DATA_FILE):
+        if record.get("metrics"):
+            previous[record["name"]] = record["metrics"]
+
+    tmp_path = config.REPORT_DATA_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
+        for repo in repos:
+            name = repo["name"]
+            f.write(json.dumps({
+                "name": name,
+                "pushedAt": repo.get("pushedAt"),
+                "updatedAt": repo.get("updatedAt"),
+                "project_id": mapping["repos"].get(name),
+                "last_synced": state["last_synced"].get(name),
+                "metrics": {**previous.get(name, {}), **metrics.get(name, {})} or None,
+            }) + "\n")
+    os.replace(tmp_path, config.REPORT_DATA_FILE)
+    print(f"[INFO] Wrote report data for {len(repos)} repos to {config.REPORT_DATA_FILE}")
+
+# --------------------
+# ROWS
+# --------------------
+def report_row(record):
+    """
+    Flattens a record into the values shown in the dashboard. Rows hold no relative dates,
+    so a repo's row (and its chunk's cache key) only changes when its data does.
+    Items in statuses outside COLUMNS (including No Status) are counted as "other"; boards
+    using other Status options (e.g. Todo/In Progress/Done) get no progress.
+    """
+    metrics = record.get("metrics") or {}
+    columns = metrics.get("columns")
+    total = sum(columns.values()) if columns else 0
+    on_schema = bool(columns) and all(c in COLUMNS or c == NO_STATUS_COLUMN for c in columns)
+    pushed = record.get("pushedAt")
+
+    return {
+        "name": record["name"],
+        "has_board": bool(record.get("project_id")),
+        "columns": [columns.get(c, 0) for c in COLUMNS] if columns else None,
+        "other": total - sum(columns.get(c, 0) for c in COLUMNS) if columns else None,
+        "progress": round(100 * columns.get(COLUMNS[-1], 0) / total) if on_schema and total else None,
+        "open_issues": metrics.get("open_issues"),
+        "open_pull_requests": metrics.get("open_pull_requests"),
+        "pushed": pushed[:10] if pushed else None,
+    }
+
+def is_stale(record, now, stale_days):
+    """True when the repo has no push within `stale_days` of `now` (or none at all)."""
+    pushed = record.get("pushedAt")
+    if not pushed:
+        return True
+    return now - datetime.fromisoformat(pushed.replace("Z", "+00:00")) > timedelta(days=stale_days)
+
+def _cell(value, suffix=""):
+    return "-" if value is None else f"{value}{suffix}"
+
+def render_markdown_rows(rows):
+    lines = []
+    for row in rows:
+        columns = row["columns"] or [None] * len(COLUMNS)
+        board = "yes" if row["has_board"] else "**missing**"
+        cells = [row["name"], board, *[_cell(c) for c in columns], _cell(row["other"]), _cell(row["progress"], "%"),
+                 _cell(row["open_issues"]), _cell(row["open_pull_requests"]), _cell(row["pushed"])]
+        lines.append("| " + " | ".join(cells) + " |\n")
+    return "".join(lines)
+
+def render_html_rows(rows):
+    lines = []
+    for row in rows:
+        columns = row["columns"] or [None] * len(COLUMNS)
+        css = "missing" if not row["has_board"] else "stale" if row["stale"] else ""
+        board = "yes" if row["has_board"] else "missing"
+        progress = "-" if row["progress"] is None else f'<progress max="100" value="{row["progress"]}"></progress> {row["progress"]}%'
+        cells = [html.escape(row["name"]), board, *[_cell(c) for c in columns], _cell(row["other"]), progress,
+                 _cell(row["open_issues"]), _cell(row["open_pull_requests"]), _cell(row["pushed"])]
+        lines.append(f'<tr class="{css}">' + "".join(f"<td>{c}</td>" for c in cells) + "</tr>\n")
+    return "".join(lines)
+
+# --------------------
+# RENDER
+# --------------------
+def _write_chunk(rows, md, html_out, cache_dir, used_keys):
+    """Writes one chunk to both outputs, from the cache when its rows are unchanged. Returns True on a hit."""
+    key = hashlib.sha256(json.dumps([RENDER_VERSION, rows], sort_keys=True).encode()).hexdigest()
+    used_keys.add(key)
+    md_path = os.path.join(cache_dir, f"{key}.md")
+    html_path = os.path.join(cache_dir, f"{key}.html")
+
+    if os.path.exists(md_path) and os.path.exists(html_path):
+        for path, out in ((md_path, md), (html_path, html_out)):
+            with open(path, "r") as f:
+                shutil.copyfileobj(f, out)
+        return True
+
+    for path, out, text in ((md_path, md, render_markdown_rows(rows)), (html_path, html_out, render_html_rows(rows))):
+        with open(path, "w") as f:
+            f.write(text)
+        out.write(text)
+    return False
+
+def _write_list(md, html_out, title, spool, empty):
+    md.write(f"\n## {title}\n\n")
+    html_out.write(f"<h2>{html.escape(title)}</h2>\n<ul>\n")
+    spool.seek(0)
+    count = 0
+    for line in spool:
+        count += 1
+        md.write(f"- {line}")
+        html_out.write(f"<li>{html.escape(line.rstrip())}</li>\n")
+    if not count:
+        md.write(f"{empty}\n")
+        html_out.write(f"<li>{empty}</li>\n")
+    html_out.write("</ul>\n")
+
+def render_report(records, out_dir, stale_days=None, chunk_size=REPORT_CHUNK_SIZE):
+    """
+    Streams `records` into out_dir/report.md and out_dir/report.html.
+    Progress is the share of a repo's board items in the last column (needs METRICS_PER_COLUMN).
+    Staleness is judged against the current time outside report_row(); it only enters a
+    chunk's cache key as a flag, which changes when a repo crosses the threshold.
+    Returns a summary dict.
+    """
+    stale_days = config.REPORT_STALE_DAYS if stale_days is None else stale_days
+    cache_dir = os.path.join(out_dir, ".cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    now = datetime.now(timezone.utc)
+    title = f"{config.USERNAME} repo dashboard"
+
+    md_path = os.path.join(out_dir, "report.md")
+    html_path = os.path.join(out_dir, "report.html")
+    summary = {"repos": 0, "stale": 0, "missing": 0, "chunks": 0, "cached_chunks": 0}
+    progress_total = progress_count = 0
+    used_keys = set()
+
+    with open(md_path + ".tmp", "w") as md, open(html_path + ".tmp", "w") as html_out, \
+            tempfile.TemporaryFile("w+") as stale_spool, tempfile.TemporaryFile("w+") as missing_spool:
+        md.write(f"# {title}\n\nGenerated {now.isoformat(timespec='seconds')}\n\n## Progress\n\n")
+        md.write("| Repo | Board | " + " | ".join(COLUMNS) + " | Other | Done | Open issues | Open PRs | Last push |\n")
+        md.write("|" + "---|" * (len(COLUMNS) + 7) + "\n")
+        html_out.write(HTML_HEAD.format(title=html.escape(title)))
+        html_out.write(f"<h1>{html.escape(title)}</h1>\n<p>Generated {now.isoformat(timespec='seconds')}</p>\n")
+        html_out.write("<h2>Progress</h2>\n<table>\n<tr><th>Repo</th><th>Board</th>"
+                       + "".join(f"<th>{html.escape(c)}</th>" for c in COLUMNS)
+                       + "<th>Other</th><th>Done</th><th>Open issues</th><th>Open PRs</th><th>Last push</th></tr>\n")
+
+        rows = []
+        for record in records:
+            row = report_row(record)
+            row["stale"] = is_stale(record, now, stale_days)
+            summary["repos"] += 1
+            if row["stale"]:
+                summary["stale"] += 1
+                stale_spool.write(f"{row['name']} (last push {row['pushed'] or 'never'})\n")
+            if not row["has_board"]:
+                summary["missing"] += 1
+                missing_spool.write(f"{row['name']}\n")
+            if row["progress"] is not None:
+                progress_total += row["progress"]
+                progress_count += 1
+
+            rows.append(row)
+            if len(rows) == chunk_size:
+                summary["cached_chunks"] += _write_chunk(rows, md, html_out, cache_dir, used_keys)
+                summary["chunks"] += 1
+                rows = []
+        if rows:
+            summary["cached_chunks"] += _write_chunk(rows, md, html_out, cache_dir, used_keys)
+            summary["chunks"] += 1
+        html_out.write("</table>\n")
+
+        _write_list(md, html_out, f"Stale repos (no push in {stale_days} days)", stale_spool, "None")
+        _write_list(md, html_out, "Missing boards", missing_spool, "None")
+
+        summary["average_progress"] = round(progress_total / progress_count) if progress_count else None
+        lines = [
+            f"Repos: {summary['repos']}",
+            f"Stale: {summary['stale']}",
+            f"Missing boards: {summary['missing']}",
+            f"Average done: {_cell(summary['average_progress'], '%')}",
+        ]
+        md.write("\n## Summary\n\n" + "".join(f"- {line}\n" for line in lines))
+        html_out.write("<h2>Summary</h2>\n<ul>\n" + "".join(f"<li>{line}</li>\n" for line in lines) + "</ul>\n")
+        html_out.write("</body>\n</html>\n")
+
+    os.replace(md_path + ".tmp", md_path)
+    os.replace(html_path + ".tmp", html_path)
+
+    # Drop chunks no longer part of the report so the cache doesn't grow without bound.
+    for filename in os.listdir(cache_dir):
+        if filename.split(".")[0] not in used_keys:
+            os.remove(os.path.join(cache_dir, filename))
+    return summary
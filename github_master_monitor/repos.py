@@ -0,0 +1,67 @@
+"""User and repository lookups."""
+from .graphql import run_query
+
+# Shared by the auth probe and get_user_id, so the viewer is resolved once per run.
+VIEWER_QUERY = "query { viewer { id login } }"
+
+def get_viewer():
+    return run_query(VIEWER_QUERY)["data"]["viewer"]
+
+def get_user_id(username):
+    viewer = get_viewer()
+    if viewer["login"].lower() == username.lower():
+        return viewer["id"]
+
+    query = """
+    query($username: String!) {
+      user(login: $username) {
+        id
+      }
+    }
+    """
+    result = run_query(query, {"username": username})
+    
+    # Debug: check if we have the expected data structure
+    if "data" not in result or not result["data"] or "user" not in result["data"]:
+        print(f"[ERROR] Unexpected response structure: {result}")
+        raise Exception(f"Failed to get user ID for {username}")
+    
+    return result["data"]["user"]["id"]
+
+def get_user_repositories(username):
+    query = """
+    query($login: String!) {
+      user(login: $login) {
+        repositories(first: 100, ownerAffiliations: OWNER) {
+          nodes { id name }
+        }
+      }
+    }
+    """
+    return run_query(query, {"login": username})["data"]["user"]["repositories"]["nodes"]
+
+def get_user_repos(username):
+    query = """
+    query($username: String!, $cursor: String) {
+      user(login: $username) {
+        repositories(first: 100, after: $cursor, ownerAffiliations: OWNER) {
+          nodes {
+            id
+            name
+            pushedAt
+            updatedAt
+          }
+          pageInfo { hasNextPage endCursor }
+        }
+      }
+    }
+    """
+    repos = []
+    cursor = None
+    while True:
+        result = run_query(query, {"username": username, "cursor": cursor}, memoize=False)
+        page = result["data"]["user"]["repositories"]
+        repos.extend(page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            return repos
+        cursor = page["pageInfo"]["endCursor"]
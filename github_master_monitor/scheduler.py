@@ -0,0 +1,71 @@
+"""Run ordering and budgets for the sync loop."""
+import time
+from datetime import datetime
+
+from . import config
+from .graphql import API_USAGE
+
+def parse_timestamp(value):
+    """Parses a GitHub ISO timestamp into epoch seconds; missing values count as 0."""
+    if not value:
+        return 0.0
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+def repo_priority(repo, state):
+    """
+    Sort key for the sync loop (lower runs first):
+    new (never synced) repos, then leftovers from the last run, then repos active since their
+    last sync (most recent activity first), then the rest by time since last sync (oldest first).
+    "New" comes from the sync state rather than the mapping, which may not be persisted (CI).
+    """
+    name = repo["name"]
+    synced_at = state["last_synced"].get(name)
+    last_synced = parse_timestamp(synced_at)
+    activity = max(parse_timestamp(repo.get("pushedAt")), parse_timestamp(repo.get("updatedAt")))
+    changed = activity > last_synced
+    return (
+        synced_at is not None,
+        name not in state["pending"],
+        not changed,
+        -activity if changed else 0,
+        last_synced,
+    )
+
+def schedule_repos(repos, state):
+    return sorted(repos, key=lambda repo: repo_priority(repo, state))
+
+class RunBudget:
+    """Wall-clock and API-point budget for one run; a limit of 0 means unlimited."""
+
+    def __init__(self, seconds=config.RUN_TIME_BUDGET_SECONDS, points=config.RUN_POINT_BUDGET):
+        self.seconds = seconds
+        self.points = points
+        self.started = time.monotonic()
+        self.start_points = API_USAGE["points"]
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def points_spent(self):
+        return API_USAGE["points"] - self.start_points
+
+    def exhausted(self, reserve=0.0):
+        """True once a limit is spent; `reserve` is a share of each limit kept for later phases."""
+        left = 1 - reserve
+        if self.seconds and self.elapsed() >= self.seconds * left:
+            return True
+        return bool(self.points and self.points_spent() >= self.points * left)
+
+    def describe(self):
+        return f"{self.elapsed():.1f}s / {self.points_spent()} points"
+
+def priority_reason(repo, state):
+    """Human-readable label for the bucket repo_priority() puts a repo in."""
+    synced, not_pending, unchanged = repo_priority(repo, state)[:3]
+    if not synced:
+        return "new"
+    if not not_pending:
+        return "left over"
+    if not unchanged:
+        return "active"
+    return "stale"
@@ -0,0 +1,44 @@
+"""Local JSON state: the repo -> project mapping and the scheduler's sync state."""
+import json
+import os
+
+from . import config
+from .profiling import phase
+
+def load_mapping():
+    if os.path.exists(config.MAPPING_FILE):
+        with open(config.MAPPING_FILE, "r") as f:
+            return json.load(f)
+    return {"master_project_id": None, "repos": {}}
+
+def save_mapping(mapping):
+    with phase("mapping save"), open(config.MAPPING_FILE, "w") as f:
+        json.dump(mapping, f, indent=2)
+
+def load_sync_state():
+    """Loads the sync state; `pending` is a set in memory and a sorted list on disk."""
+    state = {"last_synced": {}, "pending": []}
+    if os.path.exists(config.SYNC_STATE_FILE):
+        with open(config.SYNC_STATE_FILE, "r") as f:
+            state = json.load(f)
+    state["pending"] = set(state["pending"])
+    # Repo -> board ID checked against the template schema, and the boards whose Status differs
+    state.setdefault("schema_checked", {})
+    state.setdefault("off_schema", {})
+    return state
+
+def save_sync_state(state):
+    with phase("mapping save"), open(config.SYNC_STATE_FILE, "w") as f:
+        json.dump({**state, "pending": sorted(state["pending"])}, f, indent=2)
+
+def prune_sync_state(state, repo_names):
+    """Forgets repos that no longer exist (deleted or renamed) so they don't linger as pending."""
+    repo_names = set(repo_names)
+    state["pending"] &= repo_names
+    for key in ("last_synced", "schema_checked", "off_schema"):
+        state[key] = {name: value for name, value in state[key].items() if name in repo_names}
+
+def save_progress(mapping, state):
+    """Checkpoints the sync loop: both files are rewritten whole, so this runs every few repos."""
+    save_mapping(mapping)
+    save_sync_state(state)
@@ -0,0 +1,306 @@
+"""
+Offline stand-in for the GitHub GraphQL API.
+
+Serves just enough of the ProjectV2 schema for a full sync against synthetic data,
+e.g. to profile a 5,000-repo account:
+
+    python -m github_master_monitor.stub_server --repos 5000 --port 8765
+    GITHUB_GRAPHQL_URL=http://127.0.0.1:8765/graphql MASTER_PROJECT_ID=ghp_stub \\
+        github-master-monitor sync --profile
+
+`github-master-monitor sync --stub-repos N` and `github-master-monitor bench` start it for you.
+
+Queries are dispatched on the root fields they select, not parsed.
+"""
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_LOGIN = "Gianpy99"
+BUILTIN_STATUS_OPTIONS = ["Todo", "In Progress", "Done"]
+
+
+class StubGitHub:
+    """In-memory account: one user, N repos and their ProjectV2 boards."""
+
+    def __init__(self, repo_count, login=DEFAULT_LOGIN, items_per_project=3, seed=0):
+        self.lock = threading.Lock()
+        self.login = login
+        self.user_id = f"U_{login}"
+        self.items_per_project = items_per_project
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.next_id = 0
+        self.projects = {}
+        self.project_order = []
+
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.repos = []
+        for i in range(repo_count):
+            pushed = now - timedelta(hours=self.random.randint(0, 24 * 365))
+            self.repos.append({
+                "id": f"R_{i}",
+                "name": f"repo-{i:05d}",
+                "pushedAt": pushed.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "updatedAt": pushed.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            })
+        self.repos_by_name = {r["name"]: r for r in self.repos}
+
+    # --- state helpers ---
+    def new_id(self, prefix):
+        self.next_id += 1
+        return f"{prefix}_{self.next_id}"
+
+    def new_field(self, name, data_type, options=None):
+        field = {"id": self.new_id("PVTF"), "name": name, "dataType": data_type}
+        if data_type == "SINGLE_SELECT":
+            field["__typename"] = "ProjectV2SingleSelectField"
+            field["options"] = [{"id": self.new_id("OPT"), "name": o["name"], "color": o.get("color", "GRAY"),
+                                 "description": o.get("description", "")} for o in options or []]
+        else:
+            field["__typename"] = "ProjectV2Field"
+        return field
+
+    def new_project(self, title):
+        project = {
+            "id": self.new_id("PVT"),
+            "title": title,
+            "fields": [
+                self.new_field("Title", "TITLE"),
+                self.new_field("Status", "SINGLE_SELECT", [{"name": n} for n in BUILTIN_STATUS_OPTIONS]),
+            ],
+            "views": [{"name": "View 1", "layout": "TABLE_LAYOUT"}],
+            "items": [],
+        }
+        self.projects[project["id"]] = project
+        self.project_order.append(project["id"])
+        return project
+
+    def copy_project(self, source, title):
+        project = self.new_project(title)
+        project["fields"] = [
+            self.new_field(f["name"], f["dataType"], f.get("options")) for f in source["fields"]
+        ]
+        project["views"] = [dict(v) for v in source["views"]]
+        # Seed synthetic issues so per-column counts and reports have something to show.
+        repo = self.repos_by_name.get(title[:-len(" Project")]) if title.endswith(" Project") else None
+        status = next((f for f in project["fields"] if f["name"] == "Status"), None)
+        if repo and status:
+            for n in range(self.items_per_project):
+                option = self.random.choice(status["options"])
+                project["items"].append({
+                    "id": self.new_id("PVTI"),
+                    "content": {"__typename": "Issue", "id": self.new_id("I"), "title": f"Issue {n}",
+                                "repository": {"id": repo["id"], "name": repo["name"]}},
+                    "values": {status["id"]: option["name"]},
+                })
+        return project
+
+    def field_by_id(self, field_id):
+        for project in self.projects.values():
+            for field in project["fields"]:
+                if field["id"] == field_id:
+                    return field
+        return None
+
+    def draft_by_id(self, draft_id):
+        for project in self.projects.values():
+            for item in project["items"]:
+                if item["content"]["id"] == draft_id:
+                    return item
+        return None
+
+    # --- response shapes ---
+    def page(self, nodes, variables, first):
+        start = int(variables.get("cursor") or 0)
+        chunk = nodes[start:start + first]
+        end = start + len(chunk)
+        return {"nodes": chunk, "pageInfo": {"hasNextPage": end < len(nodes), "endCursor": str(end)}}
+
+    def project_list(self):
+        return [{"id": pid, "title": self.projects[pid]["title"]} for pid in self.project_order]
+
+    def item_node(self, project, item):
+        values = []
+        for field in project["fields"]:
+            if field["id"] in item["values"]:
+                values.append({
+                    "__typename": "ProjectV2ItemFieldSingleSelectValue",
+                    "field": {"__typename": "ProjectV2SingleSelectField", "id": field["id"], "name": field["name"]},
+                    "name": item["values"][field["id"]],
+                })
+        return {"id": item["id"], "content": item["content"], "fieldValues": {"nodes": values}}
+
+    def project_node(self, project, query, variables):
+        node = {"id": project["id"], "title": project["title"]}
+        if "fields(" in query:
+            node["fields"] = {"nodes": project["fields"]}
+        if "views(" in query:
+            node["views"] = {"nodes": project["views"]}
+        if "items(" in query:
+            items = self.page(project["items"], variables, 100)
+            items["nodes"] = [self.item_node(project, i) for i in items["nodes"]]
+            node["items"] = items
+        elif re.search(r"\bitems\s*\{", query):
+            node["items"] = {"totalCount": len(project["items"])}
+        return node
+
+    # --- dispatch ---
+    def execute(self, query, variables):
+        with self.lock:
+            self.requests += 1
+            if query.lstrip().startswith("mutation"):
+                return self.mutate(query, variables)
+            return self.read(query, variables)
+
+    def read(self, query, variables):
+        if "viewer" in query:
+            return {"viewer": {"login": self.login, "id": self.user_id}}
+        if "repositories(" in query:
+            user = {"repositories": self.page(self.repos, variables, 100)}
+            return {"user": user}
+        if re.search(r"\br\d+: repository\(", query):
+            return self.metrics(query, variables)
+        if "projectsV2(" in query and "user(login" in query:
+            return {"user": {"projectsV2": self.page(self.project_list(), variables, 100)}}
+        if "projectsV2(" in query:
+            return {"node": {"projectsV2": {"nodes": self.project_list()[:50]}}}
+        if "user(login" in query:
+            return {"user": {"id": self.user_id}}
+        node_id = variables.get("projectId") or variables.get("id")
+        project = self.projects.get(node_id)
+        if project is None:
+            raise KeyError(f"Could not resolve to a node with the global id of '{node_id}'")
+        return {"node": self.project_node(project, query, variables)}
+
+    def metrics(self, query, variables):
+        data = {}
+        for alias, index in re.findall(r"\b(r(\d+)): repository\(", query):
+            name = variables[f"name{index}"]
+            seed = sum(map(ord, name))
+            data[alias] = {
+                "openIssues": {"totalCount": seed % 17},
+                "openPullRequests": {"totalCount": seed % 5},
+                "pullRequests": {"totalCount": seed % 41},
+            }
+        for alias in re.findall(r"\b(r\d+_\w+): search\(", query):
+            data[alias] = {"issueCount": sum(map(ord, alias)) % 4}
+        return data
+
+    def mutate(self, query, variables):
+        if "copyProjectV2" in query:
+            project = self.copy_project(self.projects[variables["projectId"]], variables["title"])
+            return {"copyProjectV2": {"projectV2": {"id": project["id"], "title": project["title"]}}}
+        if "createProjectV2Field" in query:
+            project = self.projects[variables["projectId"]]
+            name = variables.get("name") or re.search(r'name: "([^"]+)"', query).group(1)
+            data_type = variables.get("dataType") or re.search(r"dataType: (\w+)", query).group(1)
+            field = self.new_field(name, data_type, variables.get("options"))
+            project["fields"].append(field)
+            return {"createProjectV2Field": {"projectV2Field": field}}
+        if "createProjectV2" in query:
+            project = self.new_project(variables["title"])
+            return {"createProjectV2": {"projectV2": {"id": project["id"], "title": project["title"]}}}
+        if "updateProjectV2Field" in query:
+            field = self.field_by_id(variables["fieldId"])
+            field["options"] = [{"id": self.new_id("OPT"), "name": o["name"], "color": o.get("color", "GRAY"),
+                                 "description": o.get("description", "")} for o in variables["options"]]
+            return {"updateProjectV2Field": {"projectV2Field": {"id": field["id"]}}}
+        if "addProjectV2DraftIssue" in query:
+            project = self.projects[variables["projectId"]]
+            item = {"id": self.new_id("PVTI"), "values": {},
+                    "content": {"__typename": "DraftIssue", "id": self.new_id("DI"), "title": variables["title"],
+                                "body": variables.get("body", "")}}
+            project["items"].append(item)
+            return {"addProjectV2DraftIssue": {"projectItem": {"id": item["id"], "content": {"id": item["content"]["id"]}}}}
+        if "updateProjectV2ItemFieldValue" in query:
+            project = self.projects[variables["projectId"]]
+            item = next(i for i in project["items"] if i["id"] == variables["itemId"])
+            field = self.field_by_id(variables["fieldId"])
+            option = next(o for o in field["options"] if o["id"] == variables["optionId"])
+            item["values"][field["id"]] = option["name"]
+            return {"updateProjectV2ItemFieldValue": {"projectV2Item": {"id": item["id"]}}}
+        if "updateProjectV2DraftIssue" in query:
+            data = {}
+            for alias, index in re.findall(r"\b(c(\d+)): updateProjectV2DraftIssue", query):
+                item = self.draft_by_id(variables[f"id{index}"])
+                item["content"]["body"] = variables[f"body{index}"]
+                data[alias] = {"draftIssue": {"id": item["content"]["id"]}}
+            return data
+        if "deleteProjectV2Item" in query:
+            project = self.projects[variables["projectId"]]
+            data = {}
+            for alias, index in re.findall(r"\b(d(\d+)): deleteProjectV2Item", query):
+                item_id = variables[f"item{index}"]
+                project["items"] = [i for i in project["items"] if i["id"] != item_id]
+                data[alias] = {"deletedItemId": item_id}
+            return data
+        raise ValueError("Unsupported mutation")
+
+
+def make_handler(stub):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            try:
+                body = {"data": stub.execute(payload["query"], payload.get("variables") or {})}
+            except Exception as e:
+                body = {"data": None, "errors": [{"message": str(e)}]}
+            raw = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(raw)))
+            self.send_header("X-RateLimit-Resource", "graphql")
+            self.send_header("X-RateLimit-Used", str(stub.requests))
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def start_stub_server(repo_count, port=0, **kwargs):
+    """
+    Starts the stub in a daemon thread. Returns (server, stub, url); call server.shutdown() to stop.
+    """
+    stub = StubGitHub(repo_count, **kwargs)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(stub))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stub, f"http://127.0.0.1:{server.server_address[1]}/graphql"
+
+
+def spawn_stub_server(repo_count, login=DEFAULT_LOGIN):
+    """
+    Starts the stub in a child process, so its CPU time doesn't count against the client
+    being profiled. Returns (process, url); call process.terminate() to stop.
+    """
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--repos", str(repo_count), "--port", "0", "--login", login],
+        stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    return process, line.rsplit(" at ", 1)[1].strip()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run an offline stub of the GitHub GraphQL API.")
+    parser.add_argument("--repos", type=int, default=100, help="number of synthetic repos")
+    parser.add_argument("--port", type=int, default=8765, help="0 picks a free port")
+    parser.add_argument("--login", default=DEFAULT_LOGIN)
+    args = parser.parse_args()
+
+    server, stub, url = start_stub_server(args.repos, port=args.port, login=args.login)
+    print(f"[INFO] Stub GitHub GraphQL API with {args.repos} repos at {url}", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,241 @@
+"""The full sync: repo boards, Master Project cards and metrics."""
+import os
+from datetime import datetime, timezone
+
+from .config import MASTER_PROJECT_TITLE, PROVISION_MODE, RUN_METRICS_BUDGET_SHARE, SYNC_SAVE_EVERY, USERNAME
+from .graphql import clear_read_cache, run_query
+from .master import add_repo_to_master_project, find_master_cards
+from .metrics import sync_master_metrics
+from .profiling import end_phases, start_phase
+from .projects import (create_project, create_project_if_missing, create_status_field, get_projects_for_owner,
+                       index_projects_by_title, sync_project_fields)
+from .report import write_report_data
+from .repos import VIEWER_QUERY, get_user_id, get_user_repos
+from .scheduler import RunBudget, schedule_repos
+from .state import load_mapping, load_sync_state, prune_sync_state, save_mapping, save_progress
+from .templates import ensure_template_project, provision_repo_project, validate_repo_project
+
+def check_auth():
+    """
+    Dumps token-related env vars and probes the API as the viewer.
+    Returns False when the probe fails, in which case the sync should not run.
+    """
+    # Debug: List all environment variables that might be related
+    print("[DEBUG] Checking environment variables...")
+    for key in os.environ.keys():
+        if 'PROJECT' in key.upper() or 'GITHUB' in key.upper() or 'TOKEN' in key.upper():
+            value = os.environ[key]
+            # Mask tokens for security, show length and first few chars
+            if len(value) > 10:
+                print(f"[DEBUG] {key}: length={len(value)}, starts with '{value[:6]}...'")
+            else:
+                print(f"[DEBUG] {key}: '{value}'")
+
+    # Test authentication first
+    token = os.environ.get("MASTER_PROJECT_ID")
+    if not token:
+        # Try alternative environment variable names
+        token = os.environ.get("GITHUB_TOKEN")
+        if token:
+            print("[INFO] Using GITHUB_TOKEN instead of MASTER_PROJECT_ID")
+        else:
+            print("[ERROR] No authentication token found in environment variables")
+            print("[ERROR] Available env vars:", [k for k in os.environ.keys() if 'TOKEN' in k.upper() or 'PROJECT' in k.upper()])
+            raise Exception("No GitHub token found in environment variables")
+    
+    # Debug token info
+    print(f"[DEBUG] Token length: {len(token)}")
+    print(f"[DEBUG] Token first 10 chars: '{token[:10]}'")
+    print(f"[DEBUG] Token last 10 chars: '{token[-10:]}'")
+    print(f"[DEBUG] Token has whitespace: {token != token.strip()}")
+    
+    # Clean the token of any whitespace
+    clean_token = token.strip()
+    
+    if not clean_token.startswith(('ghp_', 'github_pat_')):
+        print(f"[WARNING] Token format looks unusual. Expected to start with 'ghp_' or 'github_pat_'")
+        print(f"[DEBUG] Clean token first 15 chars: '{clean_token[:15]}'")
+
+    print("[INFO] Testing GitHub authentication...")
+    try:
+        # Same (memoized) viewer query get_user_id() uses, so the viewer is fetched once
+        result = run_query(VIEWER_QUERY)
+        
+        if "data" in result and result["data"] and "viewer" in result["data"]:
+            current_user = result["data"]["viewer"]["login"]
+            print(f"[INFO] Successfully authenticated as: {current_user}")
+            
+            if current_user != USERNAME:
+                print(f"[WARNING] Authenticated as '{current_user}' but script is configured for '{USERNAME}'")
+        else:
+            print(f"[ERROR] Unexpected response: {result}")
+            return False
+            
+    except Exception as e:
+        print(f"[ERROR] Authentication test failed: {e}")
+        return False
+    return True
+
+def resolve_master_project(mapping, owner_id):
+    """
+    Returns the Master Project ID from the mapping, or finds/creates it and saves it there.
+    """
+    master_project_id = mapping.get("master_project_id")
+    
+    print(f"[DEBUG] master_project_id from mapping: {master_project_id}")
+    
+    # FORCE CLEAR any placeholder or invalid IDs
+    if master_project_id == "ID_MASTER":
+        print(f"[INFO] DETECTED PLACEHOLDER 'ID_MASTER' - FORCE CLEARING")
+        master_project_id = None
+    elif not master_project_id:
+        print(f"[INFO] No master project ID found")
+        master_project_id = None
+    elif len(str(master_project_id)) < 10:
+        print(f"[INFO] Invalid master project ID (too short): '{master_project_id}' - CLEARING")
+        master_project_id = None
+    else:
+        print(f"[INFO] Using existing master project ID: {master_project_id}")
+    
+    # Always regenerate if we don't have a valid ID
+    if master_project_id is None:
+        print(f"[INFO] Looking for existing projects for user {USERNAME}...")
+        projects = get_projects_for_owner(USERNAME)
+        print(f"[DEBUG] Found {len(projects)} existing projects")
+        
+        for p in projects:
+            print(f"[DEBUG] Project: '{p['title']}' - ID: {p['id']}")
+        
+        master_project = next((p for p in projects if p["title"] == MASTER_PROJECT_TITLE), None)
+        if master_project:
+            master_project_id = master_project["id"]
+            print(f"[INFO] Found existing master project: {master_project_id}")
+        else:
+            print(f"[INFO] Creating new master project titled '{MASTER_PROJECT_TITLE}'...")
+            master_project_id = create_project(owner_id, MASTER_PROJECT_TITLE)
+            create_status_field(master_project_id)
+            print(f"[INFO] Created new master project: {master_project_id}")
+        
+        # Save the real project ID
+        mapping["master_project_id"] = master_project_id
+        save_mapping(mapping)
+        print(f"[INFO] Saved real master project ID to mapping file")
+    
+    print(f"[INFO] Final Master Project ID: {master_project_id}")
+    return master_project_id
+
+def discover_repos():
+    print("[INFO] Fetching user and repos...")
+    owner_id = get_user_id(USERNAME)  # recupera ID dello user
+    repos = get_user_repos(USERNAME)
+    print(f"[INFO] Found {len(repos)} repositories.")
+    return owner_id, repos
+
+def run_sync():
+    """
+    Full sync: auth probe, repo discovery, master/template setup, the scheduled per-repo
+    loop and the metrics pass, both within the run budget (the loop leaves
+    RUN_METRICS_BUDGET_SHARE of it to metrics).
+    """
+    budget = RunBudget()
+    clear_read_cache()
+    start_phase("auth probe")
+    mapping = load_mapping()
+    if not check_auth():
+        end_phases()
+        return False
+
+    start_phase("discovery")
+    owner_id, repos = discover_repos()
+
+    # --- Master Project ---
+    start_phase("master setup")
+    master_project_id = resolve_master_project(mapping, owner_id)
+
+    # Ensure master project has required fields
+    print(f"[DEBUG] About to sync fields for project ID: {master_project_id}")
+    sync_project_fields(master_project_id)
+
+    # --- Repo Projects + Sync ---
+    if PROVISION_MODE == "template":
+        existing_projects = get_projects_for_owner(USERNAME)
+        template_id = ensure_template_project(owner_id, mapping, existing_projects)
+        projects_by_title = index_projects_by_title(existing_projects)
+
+    start_phase("repo sync")
+    state = load_sync_state()
+    prune_sync_state(state, (r["name"] for r in repos))
+    scheduled = schedule_repos(repos, state)
+    synced_names = []
+    master_cards = find_master_cards(master_project_id)
+
+    # Mapping and state are saved every SYNC_SAVE_EVERY repos and once more however the loop ends
+    try:
+        for index, repo in enumerate(scheduled):
+            if budget.exhausted(reserve=RUN_METRICS_BUDGET_SHARE):
+                state["pending"] = {r["name"] for r in scheduled[index:]}
+                print(f"[INFO] Run budget spent ({budget.describe()}); "
+                      f"{len(state['pending'])} repos left for the next run")
+                break
+
+            repo_name = repo["name"]
+            repo_id = repo["id"]
+            print(f"[INFO] Checking repo: {repo_name}")
+
+            # Create or get project for this repo
+            copied = False
+            if PROVISION_MODE == "template":
+                project_id = mapping["repos"].get(repo_name)
+                if not project_id:
+                    project_id, copied = provision_repo_project(owner_id, repo_name, template_id, projects_by_title)
+            else:
+                project_id = create_project_if_missing(owner_id, repo_name)
+                sync_project_fields(project_id)
+
+            if repo_name in mapping["repos"]:
+                repo_project_id = mapping["repos"][repo_name]
+                print(f"[INFO] Repo {repo_name} already tracked with Project ID: {repo_project_id}")
+            else:
+                repo_project_id = project_id
+                mapping["repos"][repo_name] = repo_project_id
+                print(f"[INFO] Repo {repo_name} mapped with Project ID: {repo_project_id}")
+
+            # Boards not copied from the (validated) template are checked once against its schema
+            if state["schema_checked"].get(repo_name) != repo_project_id:
+                off_schema = None if copied else validate_repo_project(repo_project_id, f"{repo_name} Project")
+                state["schema_checked"][repo_name] = repo_project_id
+                if off_schema is None:
+                    state["off_schema"].pop(repo_name, None)
+                else:
+                    state["off_schema"][repo_name] = off_schema
+
+            # --- Sync to Master ---
+            # Check if this repo is already represented in the master project
+            if repo_name not in master_cards:
+                master_cards[repo_name] = add_repo_to_master_project(master_project_id, repo_id, repo_name, "Backlog")
+            else:
+                print(f"[INFO] Repo {repo_name} already exists in master project")
+
+            synced_names.append(repo_name)
+            state["last_synced"][repo_name] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+            state["pending"].discard(repo_name)
+            if len(synced_names) % SYNC_SAVE_EVERY == 0:
+                save_progress(mapping, state)
+    finally:
+        save_progress(mapping, state)
+
+    # --- Metrics ---
+    start_phase("metrics")
+    metrics = {}
+    if synced_names and budget.exhausted():
+        print(f"[INFO] Run budget spent ({budget.describe()}); skipping metrics this run")
+    elif synced_names:
+        print("[INFO] Syncing repo metrics to master cards...")
+        metrics = sync_master_metrics(master_project_id, USERNAME, synced_names, mapping["repos"],
+                                      cards=master_cards, budget=budget)
+
+    start_phase("report data")
+    write_report_data(repos, mapping, state, metrics)
+    print(f"[INFO] Run finished: {len(synced_names)}/{len(repos)} repos synced ({budget.describe()})")
+    end_phases()
+    return True
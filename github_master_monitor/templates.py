@@ -0,0 +1,205 @@
+"""Template-based provisioning: one template project, copied per repo with copyProjectV2."""
+from .config import COLORS, COLUMNS, FIELDS_TO_CREATE, STATUS_OPTIONS, TEMPLATE_PROJECT_TITLE
+from .graphql import run_query
+from .projects import create_project, create_status_field
+from .state import save_mapping
+
+# Built-in fields can't be created, only updated: the template's "Status" field carries
+# the 7 COLUMNS, while the Backlog..QA options live in "Custom Status" (STATUS_OPTIONS).
+BUILTIN_FIELDS = {"Status"}
+
+_validated_templates = set()
+
+def get_template_schema(project_id: str):
+    """
+    Reads a project's fields (with single-select options), views and item count in one query.
+    Returns (fields by name, views, item count).
+    """
+    query = """
+    query($projectId: ID!) {
+      node(id: $projectId) {
+        ... on ProjectV2 {
+          fields(first: 50) {
+            nodes {
+              ... on ProjectV2FieldCommon {
+                id
+                name
+                dataType
+              }
+              ... on ProjectV2SingleSelectField {
+                options {
+                  name
+                }
+              }
+            }
+          }
+          views(first: 20) {
+            nodes {
+              name
+              layout
+            }
+          }
+          items {
+            totalCount
+          }
+        }
+      }
+    }
+    """
+    node = run_query(query, {"projectId": project_id}, memoize=False)["data"]["node"]
+    fields = {f["name"]: f for f in node["fields"]["nodes"] if f.get("name")}
+    return fields, node["views"]["nodes"], node["items"]["totalCount"]
+
+def create_template_field(project_id: str, spec):
+    """
+    Creates one FIELDS_TO_CREATE entry on the project.
+    Entries with a "type" become plain fields, the rest SINGLE_SELECT fields.
+    """
+    mutation = """
+    mutation($projectId: ID!, $name: String!, $dataType: ProjectV2CustomFieldType!,
+             $options: [ProjectV2SingleSelectFieldOptionInput!]) {
+      createProjectV2Field(input: {
+        projectId: $projectId,
+        name: $name,
+        dataType: $dataType,
+        singleSelectOptions: $options
+      }) {
+        projectV2Field {
+          ... on ProjectV2FieldCommon { id name }
+        }
+      }
+    }
+    """
+    variables = {"projectId": project_id, "name": spec["name"], "dataType": spec.get("type", "SINGLE_SELECT"), "options": None}
+    if "type" not in spec:
+        variables["options"] = [
+            {"name": name, "color": color, "description": name}
+            for name, color in zip(spec["description"], spec["color"])
+        ]
+    run_query(mutation, variables)
+    print(f"[INFO] Created field '{spec['name']}' on project {project_id}")
+
+def update_single_select_options(field_id: str, options):
+    """
+    Replaces the options of a SINGLE_SELECT field (works for the built-in Status field too).
+    """
+    mutation = """
+    mutation($fieldId: ID!, $options: [ProjectV2SingleSelectFieldOptionInput!]) {
+      updateProjectV2Field(input: {fieldId: $fieldId, singleSelectOptions: $options}) {
+        projectV2Field {
+          ... on ProjectV2SingleSelectField { id }
+        }
+      }
+    }
+    """
+    run_query(mutation, {"fieldId": field_id, "options": options})
+
+def apply_board_schema(project_id: str, fields, rewrite_status=True):
+    """
+    Adds what a board lacks from the full schema: Status columns, Custom Status options and
+    every FIELDS_TO_CREATE field. Replacing Status options clears every item's Status, so
+    it only happens when `rewrite_status` is set.
+    Returns the Status option names when they still differ from COLUMNS, else None.
+    """
+    off_schema = None
+    status = fields.get("Status")
+    status_options = [o["name"] for o in status.get("options", [])] if status else None
+    if status and status_options != COLUMNS:
+        if rewrite_status:
+            print(f"[INFO] Setting Status columns on project {project_id} to {COLUMNS}")
+            update_single_select_options(status["id"], [
+                {"name": name, "color": color, "description": name}
+                for name, color in zip(COLUMNS, COLORS)
+            ])
+        else:
+            off_schema = status_options
+
+    custom_status = fields.get("Custom Status")
+    if not custom_status:
+        create_status_field(project_id)
+    else:
+        existing = {o["name"] for o in custom_status.get("options", [])}
+        if any(o["name"] not in existing for o in STATUS_OPTIONS):
+            print(f"[INFO] Restoring missing 'Custom Status' options on project {project_id}")
+            update_single_select_options(custom_status["id"], STATUS_OPTIONS)
+
+    for spec in FIELDS_TO_CREATE:
+        if spec["name"] not in BUILTIN_FIELDS and spec["name"] not in fields:
+            create_template_field(project_id, spec)
+    return off_schema
+
+def validate_template_project(template_id: str):
+    """
+    Makes sure the template carries the full board schema: Status columns, Custom Status
+    options and every FIELDS_TO_CREATE field. Missing pieces are added in place.
+    """
+    fields, views, _ = get_template_schema(template_id)
+    apply_board_schema(template_id, fields)
+
+    # Views can't be created through the API; copyProjectV2 copies whatever the template has.
+    if not any(v.get("layout") == "BOARD_LAYOUT" for v in views):
+        print(f"[WARNING] Template '{TEMPLATE_PROJECT_TITLE}' has no board view. "
+              f"Add one grouped by Status in the GitHub UI so every copied board gets the 7 steps.")
+
+def ensure_template_project(owner_id, mapping, projects):
+    """
+    Returns the template project ID, creating it if needed.
+    The ID is cached in the mapping file and the schema is validated once per run.
+    """
+    template_id = mapping.get("template_project_id")
+    if template_id in _validated_templates:
+        return template_id
+
+    if not template_id or not any(p["id"] == template_id for p in projects):
+        template = next((p for p in projects if p["title"] == TEMPLATE_PROJECT_TITLE), None)
+        if template:
+            template_id = template["id"]
+            print(f"[INFO] Found existing template project: {template_id}")
+        else:
+            print(f"[INFO] Creating template project titled '{TEMPLATE_PROJECT_TITLE}'...")
+            template_id = create_project(owner_id, TEMPLATE_PROJECT_TITLE)
+        mapping["template_project_id"] = template_id
+        save_mapping(mapping)
+
+    validate_template_project(template_id)
+    _validated_templates.add(template_id)
+    return template_id
+
+def copy_project_from_template(template_id, owner_id, title):
+    mutation = """
+    mutation($projectId: ID!, $ownerId: ID!, $title: String!) {
+      copyProjectV2(input: {projectId: $projectId, ownerId: $ownerId, title: $title, includeDraftIssues: false}) {
+        projectV2 { id title }
+      }
+    }
+    """
+    result = run_query(mutation, {"projectId": template_id, "ownerId": owner_id, "title": title})
+    return result["data"]["copyProjectV2"]["projectV2"]["id"]
+
+def validate_repo_project(project_id: str, title: str):
+    """
+    Brings a board that wasn't copied from the template (found by title, taken from the
+    mapping or created in "fields" mode) up to the template schema. Status is rewritten only
+    on boards without items; otherwise the board is reported as off-schema.
+    Returns the off-schema Status option names, or None when the board matches.
+    """
+    fields, _, item_count = get_template_schema(project_id)
+    off_schema = apply_board_schema(project_id, fields, rewrite_status=item_count == 0)
+    if off_schema is not None:
+        print(f"[WARNING] Board '{title}' keeps its Status options {off_schema}: rewriting them "
+              f"would clear the Status of its {item_count} items. Rename them to {COLUMNS} in the GitHub UI.")
+    return off_schema
+
+def provision_repo_project(owner_id, repo_name, template_id, projects_by_title):
+    """
+    Returns (project ID, copied): the repo's existing board, or a new copy of the template.
+    `projects_by_title` maps the owner's project titles to IDs, built once per run.
+    """
+    title = f"{repo_name} Project"
+    if title in projects_by_title:
+        return projects_by_title[title], False
+
+    project_id = copy_project_from_template(template_id, owner_id, title)
+    projects_by_title[title] = project_id
+    print(f"[INFO] Created project '{title}' from template: {project_id}")
+    return project_id, True
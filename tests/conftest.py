@@ -0,0 +1,11 @@
+import pytest
+
+from github_master_monitor import graphql
+
+
+@pytest.fixture(autouse=True)
+def fresh_read_cache():
+    """Memoized reads must not leak between tests that fake different API responses."""
+    graphql.clear_read_cache()
+    yield
+    graphql.clear_read_cache()
@@ -0,0 +1,106 @@
+"""Read coalescing in graphql.run_query, with _send_query replaced by a fake API."""
+import threading
+
+import pytest
+
+from github_master_monitor import config, graphql
+
+READ = "query($projectId: ID!) { node(id: $projectId) { ... on ProjectV2 { items(first: 100) { nodes { id } } } } }"
+ADD = "mutation($projectId: ID!) { addProjectV2DraftIssue(input: {projectId: $projectId, title: \"x\"}) { projectItem { id } } }"
+VARIABLES = {"projectId": "PVT_1"}
+
+
+@pytest.fixture(autouse=True)
+def coalescing(monkeypatch):
+    monkeypatch.setattr(config, "GRAPHQL_COALESCE", True)
+    graphql.clear_read_cache()
+    yield
+    graphql.clear_read_cache()
+
+
+def test_read_after_mutation_does_not_join_stale_in_flight_read(monkeypatch):
+    items = ["old"]
+    reads = []
+    first_read_sent = threading.Event()
+    release_first_read = threading.Event()
+
+    def fake_send(query, variables):
+        if query.lstrip().startswith("mutation"):
+            items[:] = ["new"]
+            return {"data": {}}
+        reads.append(list(items))
+        if len(reads) == 1:
+            first_read_sent.set()
+            release_first_read.wait(5)
+            return {"data": {"items": ["old"]}}
+        return {"data": {"items": list(items)}}
+
+    monkeypatch.setattr(graphql, "_send_query", fake_send)
+    results = []
+    slow_read = threading.Thread(target=lambda: results.append(graphql.run_query(READ, VARIABLES)))
+    slow_read.start()
+    assert first_read_sent.wait(5)
+
+    graphql.run_query(ADD, VARIABLES)
+    after = graphql.run_query(READ, VARIABLES)
+
+    release_first_read.set()
+    slow_read.join(5)
+    assert after["data"]["items"] == ["new"]
+    assert len(reads) == 2
+    assert results[0]["data"]["items"] == ["old"]
+    # Neither the stale read nor a later one replaces the fresh memoized result
+    assert graphql.run_query(READ, VARIABLES)["data"]["items"] == ["new"]
+    assert len(reads) == 2
+
+
+def test_interrupted_read_is_not_memoized(monkeypatch):
+    calls = []
+
+    def fake_send(query, variables):
+        calls.append(query)
+        if len(calls) == 1:
+            raise KeyboardInterrupt
+        return {"data": {"items": ["fresh"]}}
+
+    monkeypatch.setattr(graphql, "_send_query", fake_send)
+    with pytest.raises(KeyboardInterrupt):
+        graphql.run_query(READ, VARIABLES)
+
+    assert graphql.run_query(READ, VARIABLES) == {"data": {"items": ["fresh"]}}
+    assert len(calls) == 2
+
+
+def test_failed_mutation_still_invalidates(monkeypatch):
+    items = ["old"]
+    reads = []
+
+    def fake_send(query, variables):
+        if query.lstrip().startswith("mutation"):
+            items[:] = ["new"]
+            raise graphql.GraphQLError({"data": {"d0": {}}, "errors": [{"path": ["d1"], "message": "failed"}]})
+        reads.append(query)
+        return {"data": {"items": list(items)}}
+
+    monkeypatch.setattr(graphql, "_send_query", fake_send)
+    graphql.run_query(READ, VARIABLES)
+    with pytest.raises(graphql.GraphQLError):
+        graphql.run_query(ADD, VARIABLES)
+
+    assert graphql.run_query(READ, VARIABLES)["data"]["items"] == ["new"]
+    assert len(reads) == 2
+
+
+def test_unmemoized_reads_are_not_kept(monkeypatch):
+    reads = []
+
+    def fake_send(query, variables):
+        reads.append(query)
+        return {"data": {"items": []}}
+
+    monkeypatch.setattr(graphql, "_send_query", fake_send)
+    graphql.run_query(READ, VARIABLES, memoize=False)
+    graphql.run_query(READ, VARIABLES, memoize=False)
+
+    assert len(reads) == 2
+    assert not graphql._read_cache
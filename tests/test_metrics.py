@@ -0,0 +1,47 @@
+"""Metrics: batched counts with partial results, and the card body they are written to."""
+from github_master_monitor import graphql, metrics
+from github_master_monitor.config import COLUMNS, NO_STATUS_COLUMN
+from github_master_monitor.master import build_card_body
+
+
+def repo_counts(issues):
+    return {"openIssues": {"totalCount": issues}, "openPullRequests": {"totalCount": 1},
+            "pullRequests": {"totalCount": 2}}
+
+
+def test_fetch_repo_metrics_keeps_partial_data_on_not_found(monkeypatch, capsys):
+    def fake_send(query, variables):
+        raise graphql.GraphQLError({
+            "data": {"r0": None, "r1": repo_counts(4), "r1_bugs": {"issueCount": 1}},
+            "errors": [{"type": "NOT_FOUND", "path": ["r0"], "message": "Could not resolve"}],
+        })
+
+    monkeypatch.setattr(graphql, "_send_query", fake_send)
+    result = metrics.fetch_repo_metrics("owner", ["gone", "kept"])
+
+    assert list(result) == ["kept"]
+    assert result["kept"]["open_issues"] == 4
+    assert result["kept"]["bugs"] == 1
+    assert "No metrics returned for repo gone" in capsys.readouterr().out
+
+
+def test_fetch_repo_metrics_raises_other_errors(monkeypatch):
+    def fake_send(query, variables):
+        raise graphql.GraphQLError({"data": {"r0": repo_counts(1)}, "errors": [{"type": "FORBIDDEN"}]})
+
+    monkeypatch.setattr(graphql, "_send_query", fake_send)
+    try:
+        metrics.fetch_repo_metrics("owner", ["repo"])
+    except graphql.GraphQLError:
+        pass
+    else:
+        raise AssertionError("FORBIDDEN should not be treated as a partial result")
+
+
+def test_card_body_lists_statuses_outside_columns():
+    columns = {"Todo": 3, NO_STATUS_COLUMN: 1, COLUMNS[-1]: 2, "Done": 5, COLUMNS[0]: 4}
+    body = build_card_body("repo", {"columns": columns})
+
+    listed = [line[2:].rsplit(":", 1)[0] for line in body.split("**Issues per column**\n")[1].splitlines()]
+    assert listed == [COLUMNS[0], COLUMNS[-1], "Done", "Todo", NO_STATUS_COLUMN]
+    assert "- Todo: 3" in body and "- Done: 5" in body
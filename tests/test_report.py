@@ -0,0 +1,51 @@
+"""Dashboard rows, staleness and the chunk cache."""
+from datetime import datetime, timedelta, timezone
+
+from github_master_monitor.config import COLUMNS, NO_STATUS_COLUMN
+from github_master_monitor.report import is_stale, render_report, report_row
+
+
+def iso(moment):
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def record(name="repo", pushed=None, columns=None):
+    return {"name": name, "pushedAt": pushed, "project_id": "PVT_1",
+            "metrics": {"open_issues": 1, "open_pull_requests": 0, "columns": columns}}
+
+
+def test_push_today_is_not_negative_or_stale():
+    now = datetime.now(timezone.utc)
+    pushed = iso(now - timedelta(minutes=1))
+
+    assert report_row(record(pushed=pushed))["pushed"] == pushed[:10]
+    assert not is_stale(record(pushed=pushed), now, stale_days=30)
+    assert is_stale(record(pushed=iso(now - timedelta(days=31))), now, stale_days=30)
+    assert is_stale(record(pushed=None), now, stale_days=30)
+
+
+def test_statuses_outside_columns_are_other_without_progress():
+    row = report_row(record(columns={"Todo": 3, "Done": 2}))
+
+    assert row["columns"] == [0] * len(COLUMNS)
+    assert row["other"] == 5
+    assert row["progress"] is None
+
+
+def test_seven_step_board_progress_counts_no_status_as_other():
+    row = report_row(record(columns={COLUMNS[0]: 1, COLUMNS[-1]: 2, NO_STATUS_COLUMN: 1}))
+
+    assert row["other"] == 1
+    assert row["progress"] == 50
+
+
+def test_unchanged_report_is_served_from_cache(tmp_path):
+    now = datetime.now(timezone.utc)
+    records = [record(f"repo-{i}", iso(now - timedelta(days=i)), {COLUMNS[-1]: i}) for i in range(5)]
+
+    first = render_report(iter(records), str(tmp_path), stale_days=30, chunk_size=2)
+    second = render_report(iter(records), str(tmp_path), stale_days=30, chunk_size=2)
+
+    assert (first["chunks"], first["cached_chunks"]) == (3, 0)
+    assert (second["chunks"], second["cached_chunks"]) == (3, 3)
+    assert "| Other |" in (tmp_path / "report.md").read_text()
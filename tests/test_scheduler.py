@@ -0,0 +1,50 @@
+"""Sync ordering, run budgets and sync state pruning."""
+from github_master_monitor.scheduler import RunBudget, priority_reason, schedule_repos
+from github_master_monitor.state import prune_sync_state
+
+SYNCED = "2026-01-10T00:00:00+00:00"
+
+
+def repo(name, pushed):
+    return {"name": name, "pushedAt": pushed, "updatedAt": pushed}
+
+
+def test_repo_priority_ordering():
+    repos = [
+        repo("stale-old", "2025-06-01T00:00:00Z"),
+        repo("active-older", "2026-01-11T00:00:00Z"),
+        repo("left-over", "2025-06-01T00:00:00Z"),
+        repo("new", "2020-01-01T00:00:00Z"),
+        repo("active-newer", "2026-01-12T00:00:00Z"),
+        repo("stale-recent", "2025-06-01T00:00:00Z"),
+    ]
+    state = {
+        "last_synced": {
+            "stale-old": "2026-01-01T00:00:00+00:00",
+            "stale-recent": SYNCED,
+            "active-older": SYNCED,
+            "active-newer": SYNCED,
+            "left-over": SYNCED,
+        },
+        "pending": {"left-over"},
+    }
+
+    order = [r["name"] for r in schedule_repos(repos, state)]
+    assert order == ["new", "left-over", "active-newer", "active-older", "stale-old", "stale-recent"]
+    assert [priority_reason(r, state) for r in schedule_repos(repos, state)][:4] == ["new", "left over", "active", "active"]
+
+
+def test_budget_reserve_stops_earlier():
+    budget = RunBudget(seconds=0, points=100)
+    budget.start_points -= 85
+
+    assert budget.exhausted(reserve=0.2)
+    assert not budget.exhausted()
+
+
+def test_prune_sync_state_drops_missing_repos():
+    state = {"last_synced": {"kept": SYNCED, "deleted": SYNCED}, "pending": {"kept", "renamed"},
+             "schema_checked": {"deleted": "PVT_1"}, "off_schema": {"renamed": ["Todo"]}}
+
+    prune_sync_state(state, ["kept"])
+    assert state == {"last_synced": {"kept": SYNCED}, "pending": {"kept"}, "schema_checked": {}, "off_schema": {}}
@@ -0,0 +1,48 @@
+"""Board schema checks against the in-process stub API."""
+import pytest
+
+from github_master_monitor import config
+from github_master_monitor.config import COLUMNS, FIELDS_TO_CREATE
+from github_master_monitor.projects import index_projects_by_title
+from github_master_monitor.stub_server import start_stub_server
+from github_master_monitor.templates import get_template_schema, provision_repo_project, validate_repo_project
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    server, stub, url = start_stub_server(2)
+    monkeypatch.setattr(config, "API_URL", url)
+    monkeypatch.setenv("MASTER_PROJECT_ID", "ghp_stub")
+    yield stub
+    server.shutdown()
+
+
+def status_options(project_id):
+    fields, _, _ = get_template_schema(project_id)
+    return [o["name"] for o in fields["Status"]["options"]], fields
+
+
+def test_empty_reused_board_gets_full_schema(stub):
+    board = stub.new_project("repo-00000 Project")
+
+    assert validate_repo_project(board["id"], board["title"]) is None
+    options, fields = status_options(board["id"])
+    assert options == COLUMNS
+    assert {"Custom Status", *(spec["name"] for spec in FIELDS_TO_CREATE)} <= set(fields)
+
+
+def test_board_with_items_keeps_its_status_and_is_reported(stub):
+    board = stub.new_project("repo-00001 Project")
+    board["items"].append({"id": "PVTI_x", "values": {}, "content": {"__typename": "DraftIssue", "id": "DI_x"}})
+
+    assert validate_repo_project(board["id"], board["title"]) == ["Todo", "In Progress", "Done"]
+    options, fields = status_options(board["id"])
+    assert options == ["Todo", "In Progress", "Done"]
+    assert "Priority" in fields
+
+
+def test_provision_reuses_board_by_title(stub):
+    board = stub.new_project("repo-00000 Project")
+    by_title = index_projects_by_title([{"id": board["id"], "title": board["title"]}])
+
+    assert provision_repo_project("U_x", "repo-00000", "PVT_template", by_title) == (board["id"], False)